@@ -63,14 +63,14 @@ async def init_database():
         print("\n⚠️  Database is empty - generating 50 demo users...")
 
         # Import and run synthetic data generator
-        from spendsense.ingest.synthetic_generator import generate_dataset, save_dataset, load_data_from_json
+        from spendsense.ingest.synthetic_generator import generate_dataset, save_dataset, load_dataset
 
         print("   Step 1/2: Generating synthetic data...")
         dataset = generate_dataset(num_users=50)
         save_dataset(dataset)
 
         print("   Step 2/2: Loading data into database...")
-        await load_data_from_json(db)
+        await load_dataset(db, dataset)
 
         # Verify data loaded
         result = await db.execute(select(User))
@@ -14,6 +14,12 @@ from spendsense.database import AsyncSessionLocal, engine
 
 # Import all migrations
 from spendsense.migrations.migration_001_add_apr_type import migrate as migrate_001, rollback as rollback_001
+from spendsense.migrations.migration_002_add_account_type_index import migrate as migrate_002, rollback as rollback_002
+from spendsense.migrations.migration_003_composite_lookup_indexes import migrate as migrate_003, rollback as rollback_003
+from spendsense.migrations.migration_004_coded_enum_columns import migrate as migrate_004, rollback as rollback_004
+from spendsense.migrations.migration_005_drop_transaction_account_index import migrate as migrate_005, rollback as rollback_005
+from spendsense.migrations.migration_006_unique_persona_assignments import migrate as migrate_006, rollback as rollback_006
+from spendsense.migrations.migration_007_persona_assigned_at_utc import migrate as migrate_007, rollback as rollback_007
 
 # Configure logging
 logging.basicConfig(
@@ -25,6 +31,12 @@ logger = logging.getLogger(__name__)
 # List of migrations in order (name, migrate_func, rollback_func)
 MIGRATIONS = [
     ("001_add_apr_type", migrate_001, rollback_001),
+    ("002_add_account_type_index", migrate_002, rollback_002),
+    ("003_composite_lookup_indexes", migrate_003, rollback_003),
+    ("004_coded_enum_columns", migrate_004, rollback_004),
+    ("005_drop_transaction_account_index", migrate_005, rollback_005),
+    ("006_unique_persona_assignments", migrate_006, rollback_006),
+    ("007_persona_assigned_at_utc", migrate_007, rollback_007),
 ]
 
 
@@ -107,7 +107,7 @@ async def test_transactions_endpoint():
             print(f"    Date: {txn.date}")
             print(f"    Amount: ${txn.amount / 100:.2f}")
             print(f"    Merchant: {txn.merchant_name}")
-            print(f"    Category: {txn.category}")
+            print(f"    Category: {txn.personal_finance_category_primary}")
 
         # Verify elapsed time is under 100ms
         assert elapsed_ms < 100, f"Query took {elapsed_ms:.2f}ms, exceeds 100ms target"
@@ -1,7 +1,7 @@
 """Application configuration using Pydantic Settings"""
 
 import os
-from typing import List
+from typing import List, Optional
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -32,6 +32,11 @@ class Settings(BaseSettings):
     # Logging
     log_level: str = "INFO"
 
+    # UTC offset (minutes) of the clock that wrote persona assignments before
+    # they were stamped in UTC; read by migration 007 (see its docstring)
+    # Override with PERSONA_LEGACY_UTC_OFFSET_MINUTES environment variable
+    persona_legacy_utc_offset_minutes: Optional[int] = None
+
     # CORS
     cors_origins: List[str] = [
         "http://localhost:5173",  # Vite dev server (default)
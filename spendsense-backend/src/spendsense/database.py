@@ -81,7 +81,7 @@ async def init_db():
                 from spendsense.ingest.synthetic_generator import (
                     generate_dataset,
                     save_dataset,
-                    load_data_from_json,
+                    load_dataset,
                 )
 
                 logger.info("Step 1/2: Generating synthetic data...")
@@ -89,7 +89,7 @@ async def init_db():
                 save_dataset(dataset)
 
                 logger.info("Step 2/2: Loading data into database...")
-                await load_data_from_json(session)
+                await load_dataset(session, dataset)
 
                 # Verify data loaded
                 result = await session.execute(select(User))
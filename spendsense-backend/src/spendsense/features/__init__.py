@@ -11,7 +11,7 @@ Main entry point: compute_signals() orchestrates all signal detection.
 """
 
 from spendsense.features.types import BehaviorSignals
-from spendsense.features.signals import compute_signals
+from spendsense.features.signals import compute_signals, compute_signals_bulk
 from spendsense.features.income import analyze_income
 from spendsense.features.savings import analyze_savings
 from spendsense.features.credit import analyze_credit
@@ -20,6 +20,7 @@ from spendsense.features.subscriptions import detect_subscriptions
 __all__ = [
     "BehaviorSignals",
     "compute_signals",
+    "compute_signals_bulk",
     "analyze_income",
     "analyze_savings",
     "analyze_credit",
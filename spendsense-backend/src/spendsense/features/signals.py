@@ -4,8 +4,11 @@ Signal Computation Orchestrator
 Coordinates all behavioral signal detection functions to produce complete user profiles.
 """
 
+from collections import defaultdict
 from datetime import datetime, timedelta
+from typing import Dict, Sequence
 from sqlalchemy import select
+from sqlalchemy.orm import raiseload
 from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import HTTPException
 import logging
@@ -18,6 +21,9 @@ from spendsense.features.subscriptions import detect_subscriptions
 
 logger = logging.getLogger(__name__)
 
+# Transaction rows fetched per round-trip when streaming a signal window
+TRANSACTION_FETCH_SIZE = 1000
+
 
 async def compute_signals(db: AsyncSession, user_id: str, window_days: int) -> BehaviorSignals:
     """
@@ -42,6 +48,34 @@ async def compute_signals(db: AsyncSession, user_id: str, window_days: int) -> B
     Performance:
         Target: <200ms per user with indexed queries
     """
+    signals_by_user = await compute_signals_bulk(db, [user_id], window_days)
+    return signals_by_user[user_id]
+
+
+async def compute_signals_bulk(
+    db: AsyncSession,
+    user_ids: Sequence[str],
+    window_days: int
+) -> Dict[str, BehaviorSignals]:
+    """
+    Compute behavioral signals for several users within a time window.
+
+    Accounts and in-window transactions for every user are fetched with one
+    IN query each, rather than two queries per user, then grouped by user
+    and passed through the signal detection functions.
+
+    Args:
+        db: Async SQLAlchemy database session
+        user_ids: User identifiers (keep batches to a few hundred users)
+        window_days: Number of days to analyze (e.g., 30, 180)
+
+    Returns:
+        Dictionary mapping each user_id to its BehaviorSignals
+
+    Raises:
+        HTTPException(404): If any user has no accounts
+        HTTPException(500): If database query fails
+    """
     try:
         # Import models locally to avoid circular imports
         from spendsense.models.account import Account
@@ -50,95 +84,125 @@ async def compute_signals(db: AsyncSession, user_id: str, window_days: int) -> B
         # Calculate cutoff date for time window
         cutoff_date = datetime.now() - timedelta(days=window_days)
 
-        logger.info(f"Computing signals for user {user_id}, window: {window_days} days, cutoff: {cutoff_date}")
+        logger.info(f"Computing signals for {len(user_ids)} users, window: {window_days} days, cutoff: {cutoff_date}")
 
-        # Query user's accounts
+        # Query all users' accounts; raiseload makes any accidental lazy
+        # relationship access fail loudly instead of issuing a query per row
         accounts_result = await db.execute(
-            select(Account).where(Account.user_id == user_id)
+            select(Account)
+            .where(Account.user_id.in_(user_ids))
+            .options(raiseload("*"))
         )
-        accounts = accounts_result.scalars().all()
+        accounts_by_user = defaultdict(list)
+        for acc in accounts_result.scalars():
+            accounts_by_user[acc.user_id].append(acc)
 
         # Edge case: User has no accounts
-        if not accounts:
-            logger.warning(f"User {user_id} has no accounts")
-            raise HTTPException(
-                status_code=404,
-                detail=f"User {user_id} not found or has no accounts"
+        for user_id in user_ids:
+            if not accounts_by_user.get(user_id):
+                logger.warning(f"User {user_id} has no accounts")
+                raise HTTPException(
+                    status_code=404,
+                    detail=f"User {user_id} not found or has no accounts"
+                )
+
+        # Stream transactions within time window (with indexed join), tagged
+        # with the owning user so they can be grouped without a lookup. Only
+        # the columns the signal functions read are selected, so rows come
+        # back as plain tuples without building ORM instances, and yield_per
+        # fetches them in bounded chunks instead of all at once
+        txns_result = await db.stream(
+            select(
+                Transaction.id,
+                Transaction.account_id,
+                Transaction.date,
+                Transaction.amount,
+                Transaction.merchant_name,
+                Transaction.merchant_entity_id,
+                Transaction.personal_finance_category_primary,
+                Transaction.personal_finance_category_detailed,
+                Account.user_id
             )
-
-        logger.info(f"Found {len(accounts)} accounts for user {user_id}")
-
-        # Query transactions within time window (with indexed join)
-        txns_result = await db.execute(
-            select(Transaction)
             .join(Account)
             .where(
-                Account.user_id == user_id,
+                Account.user_id.in_(user_ids),
                 Transaction.date >= cutoff_date
             )
             .order_by(Transaction.date)  # Order for better cache locality
+            .execution_options(yield_per=TRANSACTION_FETCH_SIZE)
         )
-        transactions = txns_result.scalars().all()
-
-        logger.info(f"Found {len(transactions)} transactions for user {user_id} within window")
-
-        # Convert ORM objects to dictionaries for signal functions
-        accounts_dicts = [
-            {
-                "id": acc.id,
-                "type": acc.type,
-                "subtype": acc.subtype,
-                "balance": acc.current_balance,
-                "limit": acc.limit,
-                "apr": acc.apr,
-                "is_overdue": acc.is_overdue,
-                "last_payment_amount": acc.last_payment_amount,
-                "min_payment": acc.min_payment
-            }
-            for acc in accounts
-        ]
-
-        transactions_dicts = [
-            {
-                "id": txn.id,
-                "account_id": txn.account_id,
-                "date": txn.date,
-                "amount": txn.amount,
-                "merchant_name": txn.merchant_name,
-                "merchant_entity_id": txn.merchant_entity_id,
-                "personal_finance_category_primary": txn.personal_finance_category_primary,
-                "personal_finance_category_detailed": txn.personal_finance_category_detailed
-            }
-            for txn in transactions
-        ]
-
-        # Call all signal detection functions
-        logger.debug(f"Calling signal detection functions for user {user_id}")
-
-        subscriptions_data = detect_subscriptions(transactions_dicts, window_days)
-        savings_data = analyze_savings(accounts_dicts, transactions_dicts, window_days)
-        credit_data = analyze_credit(accounts_dicts, transactions_dicts)
-        income_data = analyze_income(transactions_dicts, window_days)
-
-        # Populate BehaviorSignals object
-        signals = BehaviorSignals(
-            subscriptions=subscriptions_data,
-            savings=savings_data,
-            credit=credit_data,
-            income=income_data
-        )
+        transactions_by_user = defaultdict(list)
+        async for (
+            txn_id, account_id, date, amount, merchant_name, merchant_entity_id,
+            category_primary, category_detailed, user_id
+        ) in txns_result:
+            transactions_by_user[user_id].append({
+                "id": txn_id,
+                "account_id": account_id,
+                "date": date,
+                "amount": amount,
+                "merchant_name": merchant_name,
+                "merchant_entity_id": merchant_entity_id,
+                "personal_finance_category_primary": category_primary,
+                "personal_finance_category_detailed": category_detailed
+            })
+
+        signals_by_user = {}
+        for user_id in user_ids:
+            accounts = accounts_by_user[user_id]
+            transactions = transactions_by_user.get(user_id, [])
+
+            logger.info(
+                f"Found {len(accounts)} accounts and {len(transactions)} transactions "
+                f"within window for user {user_id}"
+            )
+
+            signals_by_user[user_id] = _signals_from_rows(accounts, transactions, window_days)
 
-        logger.info(f"Successfully computed signals for user {user_id}")
+            logger.info(f"Successfully computed signals for user {user_id}")
 
-        return signals
+        return signals_by_user
 
     except HTTPException:
         # Re-raise HTTP exceptions as-is
         raise
     except Exception as e:
         # Log and wrap unexpected errors
-        logger.error(f"Error computing signals for user {user_id}: {str(e)}", exc_info=True)
+        logger.error(f"Error computing signals for users {list(user_ids)}: {str(e)}", exc_info=True)
         raise HTTPException(
             status_code=500,
             detail=f"Failed to compute signals: {str(e)}"
         )
+
+
+def _signals_from_rows(accounts: list, transactions_dicts: list, window_days: int) -> BehaviorSignals:
+    """Run all signal detection functions over one user's accounts and transaction dicts."""
+    # Convert account ORM objects to dictionaries for signal functions
+    accounts_dicts = [
+        {
+            "id": acc.id,
+            "type": acc.type,
+            "subtype": acc.subtype,
+            "balance": acc.current_balance,
+            "limit": acc.limit,
+            "apr": acc.apr,
+            "is_overdue": acc.is_overdue,
+            "last_payment_amount": acc.last_payment_amount,
+            "min_payment": acc.min_payment
+        }
+        for acc in accounts
+    ]
+
+    # Call all signal detection functions
+    subscriptions_data = detect_subscriptions(transactions_dicts, window_days)
+    savings_data = analyze_savings(accounts_dicts, transactions_dicts, window_days)
+    credit_data = analyze_credit(accounts_dicts, transactions_dicts)
+    income_data = analyze_income(transactions_dicts, window_days)
+
+    # Populate BehaviorSignals object
+    return BehaviorSignals(
+        subscriptions=subscriptions_data,
+        savings=savings_data,
+        credit=credit_data,
+        income=income_data
+    )
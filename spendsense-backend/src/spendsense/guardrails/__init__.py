@@ -16,6 +16,8 @@ from spendsense.guardrails.eligibility import (
     has_existing_account,
     is_predatory_product,
     check_eligibility,
+    build_user_eligibility_index,
+    check_eligibility_indexed,
 )
 
 __all__ = [
@@ -31,4 +33,6 @@ __all__ = [
     "has_existing_account",
     "is_predatory_product",
     "check_eligibility",
+    "build_user_eligibility_index",
+    "check_eligibility_indexed",
 ]
@@ -11,10 +11,16 @@ Implemented checks:
 """
 
 import logging
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 
 logger = logging.getLogger(__name__)
 
+# Known predatory product types, blocked outright
+_BLOCKED_TYPES = frozenset({"payday_loan", "title_loan", "rent_to_own"})
+
+# Maximum APR (%) before a product is treated as predatory; many states cap at 36%
+_APR_CAP = 36.0
+
 
 def check_income_requirement(offer: Dict[str, Any], user_income: int) -> bool:
     """
@@ -55,12 +61,14 @@ def has_existing_account(user_accounts: List[Dict[str, Any]], account_type: str)
     return False
 
 
-def is_predatory_product(offer: Dict[str, Any]) -> bool:
+def is_predatory_product(offer: Dict[str, Any], product_type: Optional[str] = None) -> bool:
     """
     Check if offer is a predatory financial product.
 
     Args:
         offer: Partner offer to evaluate
+        product_type: Offer type already lowercased by the caller, to skip
+            re-lowercasing offer["type"] when the same offer is checked repeatedly
 
     Returns:
         True if product is predatory (should be blocked)
@@ -69,36 +77,54 @@ def is_predatory_product(offer: Dict[str, Any]) -> bool:
         - Payday loans, title loans, rent-to-own
         - Any product with APR > 36% (state cap threshold)
     """
-    product_type = offer.get("type", "").lower()
+    if product_type is None:
+        product_type = offer.get("type", "").lower()
 
     # Block known predatory products
-    blocked_types = ["payday_loan", "title_loan", "rent_to_own"]
-    if product_type in blocked_types:
+    if product_type in _BLOCKED_TYPES:
         logger.warning(f"Blocked predatory product type: {product_type}")
         return True
 
     # Check for excessive fees/APR
     apr = offer.get("apr", 0.0)
-    if apr > 36.0:  # Many states cap at 36% APR
+    if apr > _APR_CAP:
         logger.warning(f"Blocked high-APR product: {apr}%")
         return True
 
     return False
 
 
-def check_eligibility(offer: Dict[str, Any], user_data: Dict[str, Any]) -> bool:
+def build_user_eligibility_index(user_data: Dict[str, Any]) -> Dict[str, Any]:
     """
-    Comprehensive eligibility check for a partner offer.
+    Precompute the per-user facts that eligibility checks look up.
 
-    Runs all eligibility checks in sequence:
-    1. Predatory product filtering (blocks high-risk products)
-    2. Income requirement verification
-    3. Existing account duplication prevention
+    Build this once per user and pass it to check_eligibility_indexed for
+    every offer being scored, instead of re-scanning the account list per offer.
 
     Args:
-        offer: Partner offer to check eligibility for
         user_data: User's financial data including accounts, income, etc.
 
+    Returns:
+        Dictionary with 'subtypes' (frozenset of account subtypes held) and
+        'income' (annual income in cents)
+    """
+    return {
+        "subtypes": frozenset(account.get("subtype") for account in user_data.get("accounts", [])),
+        "income": user_data.get("annual_income", 0),
+    }
+
+
+def check_eligibility_indexed(offer: Dict[str, Any], user_index: Dict[str, Any]) -> bool:
+    """
+    Eligibility check for a partner offer against a prebuilt user index.
+
+    Runs the same checks as check_eligibility, with the existing-account
+    check reduced to a set membership test.
+
+    Args:
+        offer: Partner offer to check eligibility for
+        user_index: Index returned by build_user_eligibility_index
+
     Returns:
         True if user is eligible for this offer
     """
@@ -107,16 +133,36 @@ def check_eligibility(offer: Dict[str, Any], user_data: Dict[str, Any]) -> bool:
         return False
 
     # Check income requirements
-    user_income = user_data.get("annual_income", 0)
-    if not check_income_requirement(offer, user_income):
+    if not check_income_requirement(offer, user_index["income"]):
         return False
 
     # Check for existing accounts (don't offer savings if they have one)
-    user_accounts = user_data.get("accounts", [])
     offer_account_type = offer.get("account_type")
-    if offer_account_type and has_existing_account(user_accounts, offer_account_type):
+    if offer_account_type and offer_account_type in user_index["subtypes"]:
         logger.info(f"User already has {offer_account_type} account")
         return False
 
     # All checks passed
     return True
+
+
+def check_eligibility(offer: Dict[str, Any], user_data: Dict[str, Any]) -> bool:
+    """
+    Comprehensive eligibility check for a partner offer.
+
+    Runs all eligibility checks in sequence:
+    1. Predatory product filtering (blocks high-risk products)
+    2. Income requirement verification
+    3. Existing account duplication prevention
+
+    When checking many offers for the same user, build the index once with
+    build_user_eligibility_index and call check_eligibility_indexed instead.
+
+    Args:
+        offer: Partner offer to check eligibility for
+        user_data: User's financial data including accounts, income, etc.
+
+    Returns:
+        True if user is eligible for this offer
+    """
+    return check_eligibility_indexed(offer, build_user_eligibility_index(user_data))
@@ -26,6 +26,28 @@ SHAME_PATTERNS = [
     r"\breckless\b",
 ]
 
+# All shame patterns fused into one case-insensitive alternation, compiled once
+# at import so each check is a single pass over the text
+_SHAME_RE = re.compile("|".join(f"(?:{pattern})" for pattern in SHAME_PATTERNS), re.IGNORECASE)
+
+
+def _anchor_token(pattern: str) -> str:
+    """Return the first literal word a shame pattern requires to match.
+
+    Words with optional characters (e.g. ``you'?re``, ``habits?``) are skipped
+    so the anchor is always a whole token that must appear in matching text.
+    """
+    words = pattern.replace(r"\b", "").split(r"\s+")
+    return next(word for word in words if word.isalpha())
+
+
+# Every shame pattern contains one of these tokens, so text without any of
+# them can skip the full regex scan entirely
+_SHAME_ANCHORS = frozenset(_anchor_token(pattern) for pattern in SHAME_PATTERNS)
+_ANCHOR_RE = re.compile(
+    r"\b(?:" + "|".join(sorted(_SHAME_ANCHORS)) + r")\b", re.IGNORECASE
+)
+
 
 def check_tone(text: str) -> Tuple[bool, List[str]]:
     """Check if text contains shaming or judgmental language.
@@ -48,13 +70,13 @@ def check_tone(text: str) -> Tuple[bool, List[str]]:
     if not text:
         return True, []
 
-    violations = []
-    text_lower = text.lower()
+    # Cheap anchor pre-check: clean text (the common case) never reaches the
+    # full pattern scan. Case is handled by re.IGNORECASE, not a lowercased copy.
+    if not _ANCHOR_RE.search(text):
+        return True, []
 
-    for pattern in SHAME_PATTERNS:
-        matches = re.finditer(pattern, text_lower, re.IGNORECASE)
-        for match in matches:
-            violations.append(match.group())
+    # Lowercase only the matched phrases, not the whole text
+    violations = [match.lower() for match in _SHAME_RE.findall(text)]
 
     if violations:
         logger.warning(
@@ -9,8 +9,12 @@ from spendsense.ingest.synthetic_generator import (
     generate_accounts,
     generate_transactions,
     generate_dataset,
+    generate_dataset_ndjson,
     save_dataset,
+    save_dataset_ndjson,
     load_data_from_json,
+    load_data_from_ndjson,
+    load_dataset,
     main,
     main_async,
 )
@@ -20,8 +24,12 @@ __all__ = [
     "generate_accounts",
     "generate_transactions",
     "generate_dataset",
+    "generate_dataset_ndjson",
     "save_dataset",
+    "save_dataset_ndjson",
     "load_data_from_json",
+    "load_data_from_ndjson",
+    "load_dataset",
     "main",
     "main_async",
 ]
@@ -2,12 +2,23 @@
 
 import asyncio
 import json
+import logging
+import multiprocessing
+import os
 import random
-from datetime import datetime
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack, nullcontext
+from dataclasses import dataclass, fields
+from datetime import datetime, timedelta
+from functools import cache, partial
+from operator import attrgetter
+from itertools import accumulate, batched, chain, islice, repeat
 from pathlib import Path
-from typing import Any
+from typing import Any, AsyncIterator, Callable, Iterable, Iterator, TextIO
 
 from faker import Faker
+from sqlalchemy.dialects.sqlite import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from spendsense.database import AsyncSessionLocal
@@ -15,10 +26,37 @@ from spendsense.models.user import User
 from spendsense.models.account import Account
 from spendsense.models.transaction import Transaction
 
+logger = logging.getLogger(__name__)
+
 # Initialize Faker with seed for deterministic output
+SEED = 42
 fake = Faker()
-Faker.seed(42)
-random.seed(42)
+Faker.seed(SEED)
+random.seed(SEED)
+
+# Default RNG for the generator functions when called directly; bundles built
+# by generate_dataset pass their own per-user random.Random instead
+_RNG = random.Random(SEED)
+
+# Records per json.dumps call when streaming the dataset to disk
+_SAVE_CHUNK_SIZE = 10_000
+
+# Dataset sections, each saved as its own <section>.ndjson file
+_NDJSON_SECTIONS = ("users", "accounts", "transactions")
+
+# Rows per executemany batch when loading the dataset into the database
+_LOAD_BATCH_SIZE = 1000
+
+# Rows per transaction when loading; committing in chunks keeps each write
+# transaction (and the WAL it grows) bounded on large datasets
+_LOAD_COMMIT_ROWS = 5000
+
+# Below this many users, worker process startup costs more than it saves
+_PARALLEL_MIN_USERS = 200
+
+# Size of the Faker name pools; picking from a list is far cheaper than walking
+# Faker's provider machinery for every row
+_POOL_SIZE = 2048
 
 # Transaction category weights with detailed subcategories
 # Format: (primary_category, detailed_category, weight)
@@ -38,6 +76,21 @@ CATEGORY_WEIGHTS = [
     ("INCOME", "INCOME", 0.15),
 ]
 
+# Category choices and cumulative weights, built once so a whole account's
+# categories can be drawn in a single random.choices call
+_CATEGORIES = [(primary, detailed) for primary, detailed, _ in CATEGORY_WEIGHTS]
+_CATEGORY_CUM_WEIGHTS = list(accumulate(weight for _, _, weight in CATEGORY_WEIGHTS))
+
+# Fixed payment channel per category, or None where the channel is random
+_CHANNEL_RULE = {
+    (primary, detailed): (
+        "other" if primary in ("UTILITIES", "INCOME")
+        else "online" if detailed in ("ONLINE_MARKETPLACES", "INTERNET_AND_CABLE")
+        else None
+    )
+    for primary, detailed, _ in CATEGORY_WEIGHTS
+}
+
 # Merchant entity IDs for recurring merchants (normalized)
 MERCHANT_ENTITIES = [
     "starbucks_corp",
@@ -54,13 +107,133 @@ MERCHANT_ENTITIES = [
     "apple_inc",
 ]
 
+# Extra chance that a non-subscription expense belongs to a recurring merchant.
+# A uniform draw from these slots picks both whether and which: every merchant
+# appears once and the remaining slots are None, giving exactly this chance.
+_MERCHANT_ENTITY_CHANCE = 0.2
+_MERCHANT_ENTITY_SLOTS = tuple(MERCHANT_ENTITIES) + (None,) * (
+    round(len(MERCHANT_ENTITIES) / _MERCHANT_ENTITY_CHANCE) - len(MERCHANT_ENTITIES)
+)
+
+# Core account types that every user needs for signal detection
+CORE_ACCOUNT_TYPES = (
+    ("depository", "checking"),   # Required for income signals
+    ("credit", "credit_card"),    # Required for credit signals
+    ("depository", "savings"),    # Required for savings signals
+)
+
+# Additional account types for variety
+EXTRA_ACCOUNT_TYPES = (
+    ("loan", "mortgage"),
+    ("loan", "student_loan"),
+    ("depository", "money_market"),
+)
+
+# Display forms of account subtypes and merchant entity IDs, built once
+_SUBTYPE_TITLES = {
+    subtype: subtype.replace("_", " ").title()
+    for _, subtype in CORE_ACCOUNT_TYPES + EXTRA_ACCOUNT_TYPES
+}
+_MERCHANT_DISPLAY = {merchant: merchant.replace("_", " ").title() for merchant in MERCHANT_ENTITIES}
+
 # Payment channel options
 PAYMENT_CHANNELS = ["online", "in_store", "other"]
 
 
-def generate_user() -> dict[str, Any]:
-    """Generate a single synthetic user profile"""
-    user_id = fake.uuid4()
+@dataclass(slots=True)
+class TransactionRow:
+    """A generated transaction.
+
+    A slotted row takes roughly a third of the memory of the equivalent dict,
+    which adds up across a large dataset. Used only between generation and
+    the loader; the public generators return plain dicts.
+    """
+    id: str
+    account_id: str
+    date: datetime
+    amount: int
+    merchant_name: str | None
+    merchant_entity_id: str | None
+    personal_finance_category_primary: str
+    personal_finance_category_detailed: str | None
+    payment_channel: str | None
+    pending: bool
+
+
+_TRANSACTION_FIELDS = tuple(field.name for field in fields(TransactionRow))
+_transaction_values = attrgetter(*_TRANSACTION_FIELDS)
+
+
+def _row_to_dict(obj: Any) -> dict[str, Any]:
+    """Convert a TransactionRow into a plain dict keyed by column name"""
+    return dict(zip(_TRANSACTION_FIELDS, _transaction_values(obj)))
+
+
+def _public_record(record: Any) -> dict[str, Any]:
+    """Convert a generated record into its public form, with ISO-string datetimes"""
+    if isinstance(record, TransactionRow):
+        record = _row_to_dict(record)
+    return {key: value.isoformat() if isinstance(value, datetime) else value for key, value in record.items()}
+
+
+def _json_default(obj: Any) -> Any:
+    """json.dumps default hook for TransactionRow objects and datetimes"""
+    if isinstance(obj, TransactionRow):
+        return _row_to_dict(obj)
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+@cache
+def _company_pool() -> list[str]:
+    """Return a pool of Faker company names, built on first use"""
+    # Own seeded Faker so the pool is identical in every worker process
+    pool_fake = Faker()
+    pool_fake.seed_instance(SEED)
+    return [pool_fake.company() for _ in range(_POOL_SIZE)]
+
+
+@cache
+def _name_pool() -> list[str]:
+    """Return a pool of Faker person names, built on first use"""
+    pool_fake = Faker()
+    pool_fake.seed_instance(SEED + 1)
+    return [pool_fake.name() for _ in range(_POOL_SIZE)]
+
+
+def _uuid4(rng: random.Random = _RNG) -> str:
+    """Return a random UUID4 string drawn from rng"""
+    return str(uuid.UUID(int=rng.getrandbits(128), version=4))
+
+
+def _random_datetime(window: tuple[float, float], rng: random.Random = _RNG) -> datetime:
+    """Return a random datetime within a (start, end) POSIX-timestamp window"""
+    return datetime.fromtimestamp(rng.uniform(*window))
+
+
+def _rand_date(now: datetime, days_min: float, days_max: float, rng: random.Random = _RNG) -> datetime:
+    """Return a random datetime between days_max and days_min days before now"""
+    return now - timedelta(seconds=rng.uniform(days_min * 86400, days_max * 86400))
+
+
+def _bulk_uuids(n: int, rng: random.Random = _RNG) -> list[str]:
+    """Return n random UUID4 strings drawn from rng"""
+    getrandbits = rng.getrandbits
+    return [str(uuid.UUID(int=getrandbits(128), version=4)) for _ in range(n)]
+
+
+def _bulk_timestamps(n: int, window: tuple[float, float], rng: random.Random = _RNG) -> list[float]:
+    """Return n random POSIX timestamps within a (start, end) window"""
+    start, end = window
+    span = end - start
+    rand = rng.random
+    return [start + rand() * span for _ in range(n)]
+
+
+def _generate_user_row(rng: random.Random = _RNG) -> dict[str, Any]:
+    """Generate a single synthetic user profile with a datetime created_at"""
+    user_id = _uuid4(rng)
     # Ensure unique email by incorporating uuid
     base_email = fake.email()
     username, domain = base_email.split('@')
@@ -68,15 +241,15 @@ def generate_user() -> dict[str, Any]:
 
     return {
         "id": user_id,
-        "name": fake.name(),
+        "name": rng.choice(_name_pool()),
         "email": unique_email,
         "consent": False,
-        "created_at": fake.date_time_between(start_date="-2y").isoformat(),
+        "created_at": _rand_date(datetime.now(), 0, 730, rng),
     }
 
 
-def generate_accounts(user_id: str) -> list[dict[str, Any]]:
-    """Generate 3-5 accounts for a user with Plaid-compliant fields.
+def _generate_account_rows(user_id: str, rng: random.Random = _RNG) -> list[dict[str, Any]]:
+    """Generate 3-5 accounts for a user with Plaid-compliant fields and datetime dates.
 
     Ensures each user has at minimum:
     - 1 checking account (for income transactions)
@@ -87,42 +260,36 @@ def generate_accounts(user_id: str) -> list[dict[str, Any]]:
     """
     accounts = []
 
-    # Core account types that every user needs for signal detection
-    core_account_types = [
-        ("depository", "checking"),   # Required for income signals
-        ("credit", "credit_card"),    # Required for credit signals
-        ("depository", "savings"),    # Required for savings signals
-    ]
-
-    # Additional account types for variety
-    extra_account_types = [
-        ("loan", "mortgage"),
-        ("loan", "student_loan"),
-        ("depository", "money_market"),
-    ]
-
     # Start with core accounts
-    selected_types = list(core_account_types)
+    selected_types = list(CORE_ACCOUNT_TYPES)
 
     # Add 0-2 extra account types
-    num_extra = random.randint(0, 2)
+    num_extra = rng.randint(0, 2)
     if num_extra > 0:
-        selected_types.extend(random.sample(extra_account_types, min(num_extra, len(extra_account_types))))
+        selected_types.extend(rng.sample(EXTRA_ACCOUNT_TYPES, min(num_extra, len(EXTRA_ACCOUNT_TYPES))))
 
+    # Date windows for payment/statement fields, anchored once per call instead
+    # of having Faker parse relative date strings against datetime.now() per field
+    now = datetime.now()
+    last_30_days = ((now - timedelta(days=30)).timestamp(), now.timestamp())
+    days_60_to_30_ago = ((now - timedelta(days=60)).timestamp(), (now - timedelta(days=30)).timestamp())
+    next_30_days = ((now + timedelta(days=1)).timestamp(), (now + timedelta(days=30)).timestamp())
+
+    companies = _company_pool()
     for account_type, subtype in selected_types:
-        account_id = fake.uuid4()
+        account_id = _uuid4(rng)
 
         # Generate Plaid-compliant balance fields
-        current = random.randint(100, 50000) * 100  # in cents
-        available = current - random.randint(0, 500) * 100  # slightly less available
+        current = rng.randint(100, 50000) * 100  # in cents
+        available = current - rng.randint(0, 500) * 100  # slightly less available
 
         account = {
             "id": account_id,
             "user_id": user_id,
             "type": account_type,
             "subtype": subtype,
-            "name": f"{fake.company()} {subtype.replace('_', ' ').title()}",
-            "mask": fake.bothify(text="####"),
+            "name": f"{rng.choice(companies)} {_SUBTYPE_TITLES[subtype]}",
+            "mask": f"{rng.randrange(10000):04d}",
             "current_balance": current,
             "available_balance": available,
             "currency": "USD",
@@ -131,11 +298,11 @@ def generate_accounts(user_id: str) -> list[dict[str, Any]]:
 
         # Add credit card specific fields
         if account_type == "credit":
-            limit = random.randint(1000, 25000) * 100
+            limit = rng.randint(1000, 25000) * 100
             account["limit"] = limit
-            account["apr"] = round(random.uniform(12.99, 29.99), 2)
+            account["apr"] = round(rng.uniform(12.99, 29.99), 2)
             # APR types: purchase (70%), cash_advance (20%), penalty (10%)
-            account["apr_type"] = random.choices(
+            account["apr_type"] = rng.choices(
                 ["purchase", "cash_advance", "penalty"],
                 weights=[0.7, 0.2, 0.1]
             )[0]
@@ -143,11 +310,11 @@ def generate_accounts(user_id: str) -> list[dict[str, Any]]:
             account["is_overdue"] = False
 
             # Credit card payment tracking fields
-            account["last_payment_amount"] = random.randint(50, 500) * 100
-            account["last_payment_date"] = fake.date_time_between(start_date="-30d").isoformat()
-            account["next_payment_due_date"] = fake.date_time_between(start_date="+1d", end_date="+30d").isoformat()
-            account["last_statement_balance"] = random.randint(100, 2000) * 100
-            account["last_statement_date"] = fake.date_time_between(start_date="-60d", end_date="-30d").isoformat()
+            account["last_payment_amount"] = rng.randint(50, 500) * 100
+            account["last_payment_date"] = _random_datetime(last_30_days, rng)
+            account["next_payment_due_date"] = _random_datetime(next_30_days, rng)
+            account["last_statement_balance"] = rng.randint(100, 2000) * 100
+            account["last_statement_date"] = _random_datetime(days_60_to_30_ago, rng)
             account["interest_rate"] = None
         elif account_type == "loan":
             # Loan-specific fields (mortgages and student loans)
@@ -163,16 +330,16 @@ def generate_accounts(user_id: str) -> list[dict[str, Any]]:
 
             if subtype == "mortgage":
                 # Mortgage: $100k-$500k balance, 3-7% interest rate
-                account["current_balance"] = random.randint(100000, 500000) * 100  # $100k-$500k in cents
+                account["current_balance"] = rng.randint(100000, 500000) * 100  # $100k-$500k in cents
                 account["available_balance"] = None  # Loans don't have available balance
-                account["interest_rate"] = round(random.uniform(0.03, 0.07), 4)  # 3-7%
-                account["next_payment_due_date"] = fake.date_time_between(start_date="+1d", end_date="+30d").isoformat()
+                account["interest_rate"] = round(rng.uniform(0.03, 0.07), 4)  # 3-7%
+                account["next_payment_due_date"] = _random_datetime(next_30_days, rng)
             elif subtype == "student_loan":
                 # Student loan: $10k-$150k balance, 4-8% interest rate
-                account["current_balance"] = random.randint(10000, 150000) * 100  # $10k-$150k in cents
+                account["current_balance"] = rng.randint(10000, 150000) * 100  # $10k-$150k in cents
                 account["available_balance"] = None  # Loans don't have available balance
-                account["interest_rate"] = round(random.uniform(0.04, 0.08), 4)  # 4-8%
-                account["next_payment_due_date"] = fake.date_time_between(start_date="+1d", end_date="+30d").isoformat()
+                account["interest_rate"] = round(rng.uniform(0.04, 0.08), 4)  # 4-8%
+                account["next_payment_due_date"] = _random_datetime(next_30_days, rng)
         else:
             # Depository accounts (checking, savings)
             account["limit"] = None
@@ -192,129 +359,229 @@ def generate_accounts(user_id: str) -> list[dict[str, Any]]:
     return accounts
 
 
-def generate_transactions(account: dict[str, Any]) -> list[dict[str, Any]]:
+def _draw_amounts(categories: list[tuple[str, str]], rng: random.Random = _RNG) -> list[int]:
+    """Draw an amount in cents for each (primary, detailed) category.
+
+    Income is negative (credit to account) at $2,000-$6,000; expenses are
+    positive (debit from account) at $5-$250. Kept as one tight comprehension
+    with the RNG bound locally, apart from the per-row bookkeeping loop.
+    """
+    randint = rng.randint
+    return [
+        -randint(2000, 6000) * 100 if primary == "INCOME" else randint(5, 250) * 100
+        for primary, _ in categories
+    ]
+
+
+def _iter_transaction_rows(account: dict[str, Any], rng: random.Random = _RNG) -> Iterator[TransactionRow]:
     """Generate 40-100 transactions for an account with Plaid-compliant fields.
 
     Ensures realistic patterns for signal detection:
     - Multiple recurring subscriptions (3+ transactions from same merchant)
     - Regular income deposits if checking account
     - Mixed spending patterns
-    """
-    num_transactions = random.randint(40, 100)
-    transactions = []
 
-    # Extract category data and weights
-    category_data = [(primary, detailed, weight) for primary, detailed, weight in CATEGORY_WEIGHTS]
-    weights = [weight for _, _, weight in category_data]
+    Transactions are built column by column (one list per field) and yielded
+    as TransactionRow objects one at a time, already sorted by date, so a
+    streaming consumer never holds the account's rows all at once.
+    """
+    num_transactions = rng.randint(40, 100)
+    companies = _company_pool()
+
+    # Dates are offsets from one anchor, rather than Faker parsing relative
+    # date strings against datetime.now() for every subscription row
+    now = datetime.now()
+
+    transaction_ids: list[str] = []
+    timestamps: list[float] = []  # Numeric sort key, parallel to dates
+    dates: list[datetime] = []
+    amounts: list[int] = []
+    merchant_names: list[str] = []
+    merchant_entity_ids: list[str | None] = []
+    primaries: list[str] = []
+    detaileds: list[str] = []
+    payment_channels: list[str] = []
+    pending_flags: list[bool] = []
 
     # Select 2-4 recurring merchants for this account (subscriptions)
-    num_recurring = random.randint(2, 4)
-    account_recurring_merchants = random.sample(MERCHANT_ENTITIES, num_recurring)
+    num_recurring = rng.randint(2, 4)
+    account_recurring_merchants = rng.sample(MERCHANT_ENTITIES, num_recurring)
 
     # Generate subscription transactions first (ensures 3+ per merchant)
     for merchant_id in account_recurring_merchants:
         # Generate 3-6 recurring transactions for each subscription
-        num_subscription_txns = random.randint(3, 6)
-        subscription_amount = random.randint(10, 100) * 100  # $10-$100
+        num_subscription_txns = rng.randint(3, 6)
+        subscription_amount = rng.randint(10, 100) * 100  # $10-$100
 
         for i in range(num_subscription_txns):
             # Space transactions about 30 days apart for monthly pattern
-            days_ago = 180 - (i * 30) - random.randint(-3, 3)
+            days_ago = 180 - (i * 30) - rng.randint(-3, 3)
             if days_ago < 0:
-                days_ago = random.randint(0, 30)
-
-            transaction = {
-                "id": fake.uuid4(),
-                "account_id": account["id"],
-                "date": fake.date_time_between(start_date=f"-{days_ago}d", end_date=f"-{max(0, days_ago-5)}d").isoformat(),
-                "amount": subscription_amount + random.randint(-100, 100),  # Small variance
-                "merchant_name": merchant_id.replace("_", " ").title(),
-                "merchant_entity_id": merchant_id,
-                "personal_finance_category_primary": "GENERAL_MERCHANDISE",
-                "personal_finance_category_detailed": "ONLINE_MARKETPLACES",
-                "payment_channel": "online",
-                "pending": False,
-            }
-            transactions.append(transaction)
+                days_ago = rng.randint(0, 30)
+
+            transaction_ids.append(_uuid4(rng))
+            date = _rand_date(now, max(0, days_ago - 5), days_ago, rng)
+            dates.append(date)
+            timestamps.append(date.timestamp())
+            amounts.append(subscription_amount + rng.randint(-100, 100))  # Small variance
+
+        # Subscription rows share everything else per merchant
+        merchant_names.extend(repeat(_MERCHANT_DISPLAY[merchant_id], num_subscription_txns))
+        merchant_entity_ids.extend(repeat(merchant_id, num_subscription_txns))
+        primaries.extend(repeat("GENERAL_MERCHANDISE", num_subscription_txns))
+        detaileds.extend(repeat("ONLINE_MARKETPLACES", num_subscription_txns))
+        payment_channels.extend(repeat("online", num_subscription_txns))
+        pending_flags.extend(repeat(False, num_subscription_txns))
 
     # Generate remaining transactions randomly
-    remaining = num_transactions - len(transactions)
-    for _ in range(remaining):
-        transaction_id = fake.uuid4()
-        date = fake.date_time_between(start_date="-180d")
-
-        # Select category
-        primary, detailed, _ = random.choices(category_data, weights=weights)[0]
-
-        # Generate amount based on primary category
-        if primary == "INCOME":
-            # Income is negative (credit to account)
-            amount = -random.randint(2000, 6000) * 100
-            merchant_name = fake.company()
-            merchant_entity_id = None  # Income typically doesn't have merchant entities
-        else:
-            # Expenses are positive (debit from account)
-            amount = random.randint(5, 250) * 100
-            merchant_name = fake.company()
-            # Additional 20% chance of recurring merchant (besides subscriptions above)
-            merchant_entity_id = random.choice(MERCHANT_ENTITIES) if random.random() < 0.2 else None
-
-        # 5% of transactions are pending
-        pending = random.random() < 0.05
-
-        # Generate payment channel based on category
-        if primary in ["UTILITIES", "INCOME"]:
-            payment_channel = "other"
-        elif detailed in ["ONLINE_MARKETPLACES", "INTERNET_AND_CABLE"]:
-            payment_channel = "online"
+    remaining = num_transactions - len(transaction_ids)
+
+    # Draw every category, pending flag, merchant, merchant entity and payment
+    # channel for this account up front (rows that end up not needing an entity
+    # or a random channel just ignore their draw)
+    categories = rng.choices(_CATEGORIES, cum_weights=_CATEGORY_CUM_WEIGHTS, k=remaining)
+    pending_flags.extend([rng.random() < 0.05 for _ in range(remaining)])
+    entity_draws = rng.choices(_MERCHANT_ENTITY_SLOTS, k=remaining)
+    channel_draws = rng.choices(PAYMENT_CHANNELS, k=remaining)
+    amounts.extend(_draw_amounts(categories, rng))
+
+    # IDs and dates (last 180 days) for the whole batch in one pass each,
+    # instead of a Faker call per row
+    transaction_ids.extend(_bulk_uuids(remaining, rng))
+    random_timestamps = _bulk_timestamps(remaining, ((now - timedelta(days=180)).timestamp(), now.timestamp()), rng)
+    timestamps.extend(random_timestamps)
+    dates.extend(map(datetime.fromtimestamp, random_timestamps))
+
+    merchant_names.extend(rng.choices(companies, k=remaining))
+
+    # Resolve the category-dependent columns in one pass each
+    primaries.extend(primary for primary, _ in categories)
+    detaileds.extend(detailed for _, detailed in categories)
+    # Income typically doesn't have merchant entities; other rows keep their
+    # draw (an additional 20% chance of a recurring merchant)
+    merchant_entity_ids.extend(
+        None if primary == "INCOME" else entity_draw
+        for (primary, _), entity_draw in zip(categories, entity_draws)
+    )
+    # Payment channel is fixed for some categories, random otherwise
+    payment_channels.extend(
+        _CHANNEL_RULE[category] or channel_draw
+        for category, channel_draw in zip(categories, channel_draws)
+    )
+
+    # Sort by date (oldest first) with an argsort over the numeric timestamps,
+    # which compare much faster than datetimes, then assemble rows in that order
+    order = sorted(range(len(timestamps)), key=timestamps.__getitem__)
+    account_id = account["id"]
+    for i in order:
+        yield TransactionRow(
+            transaction_ids[i],
+            account_id,
+            dates[i],
+            amounts[i],
+            merchant_names[i],
+            merchant_entity_ids[i],
+            primaries[i],
+            detaileds[i],
+            payment_channels[i],
+            pending_flags[i],
+        )
+
+
+def generate_user(rng: random.Random = _RNG) -> dict[str, Any]:
+    """Generate a single synthetic user profile"""
+    return _public_record(_generate_user_row(rng))
+
+
+def generate_accounts(user_id: str, rng: random.Random = _RNG) -> list[dict[str, Any]]:
+    """Generate 3-5 accounts for a user with Plaid-compliant fields (see _generate_account_rows)"""
+    return [_public_record(account) for account in _generate_account_rows(user_id, rng)]
+
+
+def generate_transactions(account: dict[str, Any], rng: random.Random = _RNG) -> list[dict[str, Any]]:
+    """Generate 40-100 transactions for an account, sorted by date (see _iter_transaction_rows)"""
+    return [_public_record(row) for row in _iter_transaction_rows(account, rng)]
+
+
+def _generate_user_bundle(seed_offset: int) -> tuple[dict[str, Any], list[dict[str, Any]], list[TransactionRow]]:
+    """Generate one user with their accounts and transactions from a per-user seed"""
+    # A private RNG per user keeps workers independent of the module-level
+    # random state and of each other; Faker gets the same seed
+    seed = SEED + seed_offset
+    rng = random.Random(seed)
+    fake.seed_instance(seed)
+
+    user = _generate_user_row(rng)
+    accounts = _generate_account_rows(user["id"], rng)
+    transactions = [
+        transaction
+        for account in accounts
+        for transaction in _iter_transaction_rows(account, rng)
+    ]
+    return user, accounts, transactions
+
+
+def _iter_user_bundles(
+    num_users: int, workers: int | None
+) -> Iterator[tuple[dict[str, Any], list[dict[str, Any]], list[TransactionRow]]]:
+    """Yield each user's (user, accounts, transactions) bundle in user order.
+
+    Runs of at least _PARALLEL_MIN_USERS users are spread over `workers`
+    processes (default: one per CPU); workers=1 always generates in-process.
+    """
+    processes = workers or os.cpu_count() or 1
+    parallel = processes > 1 and num_users >= _PARALLEL_MIN_USERS
+
+    # Spawned (not forked) workers, since callers may already be running an
+    # event loop with database threads
+    executor = (
+        ProcessPoolExecutor(max_workers=processes, mp_context=multiprocessing.get_context("spawn"))
+        if parallel
+        else nullcontext()
+    )
+    with executor as pool:
+        if pool is not None:
+            chunksize = max(1, num_users // (processes * 4))
+            bundles = pool.map(_generate_user_bundle, range(num_users), chunksize=chunksize)
         else:
-            payment_channel = random.choice(PAYMENT_CHANNELS)
-
-        transaction = {
-            "id": transaction_id,
-            "account_id": account["id"],
-            "date": date.isoformat(),
-            "amount": amount,
-            "merchant_name": merchant_name,
-            "merchant_entity_id": merchant_entity_id,
-            "personal_finance_category_primary": primary,
-            "personal_finance_category_detailed": detailed,
-            "payment_channel": payment_channel,
-            "pending": pending,
-        }
+            bundles = map(_generate_user_bundle, range(num_users))
 
-        transactions.append(transaction)
+        for i, bundle in enumerate(bundles):
+            yield bundle
 
-    # Sort transactions by date (oldest first)
-    transactions.sort(key=lambda t: t["date"])
+            if (i + 1) % 10 == 0:
+                logger.info("  Generated %d/%d users...", i + 1, num_users)
 
-    return transactions
 
+def generate_dataset(num_users: int = 50, workers: int | None = None) -> dict[str, list[dict[str, Any]]]:
+    """Generate complete dataset with users, accounts, and transactions.
 
-def generate_dataset(num_users: int = 50) -> dict[str, list[dict[str, Any]]]:
-    """Generate complete dataset with users, accounts, and transactions"""
-    print(f"Generating dataset with {num_users} users...")
+    Records are plain dicts with ISO-string datetimes. Every user is generated from its own seed, so the output is the same whether
+    users are built in-process or across worker processes. Runs of at least
+    _PARALLEL_MIN_USERS users are spread over `workers` processes (default: one
+    per CPU); pass workers=1 to always generate in-process.
+    """
+    dataset = _generate_dataset_rows(num_users, workers)
+    return {section: [_public_record(record) for record in records] for section, records in dataset.items()}
 
-    all_users = []
-    all_accounts = []
-    all_transactions = []
 
-    for i in range(num_users):
-        # Generate user
-        user = generate_user()
-        all_users.append(user)
+def _generate_dataset_rows(num_users: int, workers: int | None) -> dict[str, list[Any]]:
+    """Generate a dataset in its loader form: datetime values and TransactionRow objects"""
+    logger.info("Generating dataset with %d users...", num_users)
 
-        # Generate accounts for user
-        accounts = generate_accounts(user["id"])
-        all_accounts.extend(accounts)
+    # One slot per user, filled in order; per-user account and transaction
+    # lists are flattened once at the end rather than extended user by user
+    all_users = [None] * num_users
+    account_lists = [None] * num_users
+    transaction_lists = [None] * num_users
 
-        # Generate transactions for each account
-        for account in accounts:
-            transactions = generate_transactions(account)
-            all_transactions.extend(transactions)
+    for i, (user, accounts, transactions) in enumerate(_iter_user_bundles(num_users, workers)):
+        all_users[i] = user
+        account_lists[i] = accounts
+        transaction_lists[i] = transactions
 
-        if (i + 1) % 10 == 0:
-            print(f"  Generated {i + 1}/{num_users} users...")
+    all_accounts = list(chain.from_iterable(account_lists))
+    all_transactions = list(chain.from_iterable(transaction_lists))
 
     dataset = {
         "users": all_users,
@@ -322,119 +589,291 @@ def generate_dataset(num_users: int = 50) -> dict[str, list[dict[str, Any]]]:
         "transactions": all_transactions,
     }
 
-    print("\nGeneration complete:")
-    print(f"  - {len(all_users)} users")
-    print(f"  - {len(all_accounts)} accounts")
-    print(f"  - {len(all_transactions)} transactions")
+    logger.info(
+        "Generation complete: %d users, %d accounts, %d transactions",
+        len(all_users), len(all_accounts), len(all_transactions),
+    )
 
     return dataset
 
 
-def save_dataset(dataset: dict[str, Any], output_path: str = "data/users.json"):
-    """Save dataset to JSON file"""
+def generate_dataset_ndjson(
+    num_users: int = 50, output_dir: str = "data", workers: int | None = None
+) -> dict[str, int]:
+    """Generate a dataset straight into NDJSON files, one user at a time.
+
+    Writes the same users/accounts/transactions.ndjson files as
+    save_dataset_ndjson without ever building the full dataset: each user's
+    bundle is written out and dropped before the next one is generated, so
+    memory stays flat however many users are requested. Returns row counts.
+    """
+    logger.info("Generating NDJSON dataset with %d users...", num_users)
+
+    directory = Path(output_dir)
+    directory.mkdir(exist_ok=True, parents=True)
+    encode = partial(json.dumps, separators=(",", ":"), default=_json_default)
+    counts = dict.fromkeys(_NDJSON_SECTIONS, 0)
+
+    with ExitStack() as stack:
+        files = [stack.enter_context(open(directory / f"{section}.ndjson", "w")) for section in _NDJSON_SECTIONS]
+        for bundle in _iter_user_bundles(num_users, workers):
+            # Bundle order matches _NDJSON_SECTIONS: user, accounts, transactions
+            user, accounts, transactions = bundle
+            for section, f, records in zip(_NDJSON_SECTIONS, files, ([user], accounts, transactions)):
+                f.write("".join(f"{encode(record)}\n" for record in records))
+                counts[section] += len(records)
+
+    logger.info(
+        "Generation complete: %d users, %d accounts, %d transactions",
+        counts["users"], counts["accounts"], counts["transactions"],
+    )
+
+    return counts
+
+
+def _write_compact_json(f, dataset: dict[str, Any]) -> None:
+    """Stream dataset as compact JSON, encoding each section in fixed-size chunks.
+
+    Each chunk goes through one json.dumps call (the C encoder; json.dump
+    streams through the pure-Python one), so peak memory is bounded by the
+    chunk size rather than the size of the whole encoded dataset.
+    """
+    encode = partial(json.dumps, separators=(",", ":"), default=_json_default)
+    f.write("{")
+    for section_index, (key, items) in enumerate(dataset.items()):
+        if section_index:
+            f.write(",")
+        f.write(f"{encode(key)}:[")
+        for chunk_index, chunk in enumerate(batched(items, _SAVE_CHUNK_SIZE)):
+            if chunk_index:
+                f.write(",")
+            # Drop the list brackets so chunks join into one JSON array
+            f.write(encode(chunk)[1:-1])
+        f.write("]")
+    f.write("}")
+
+
+def save_dataset(dataset: dict[str, Any], output_path: str = "data/users.json", pretty: bool = False):
+    """Save dataset to JSON file (compact unless pretty=True)"""
     output_file = Path(output_path)
     output_file.parent.mkdir(exist_ok=True)
 
     with open(output_file, "w") as f:
-        json.dump(dataset, f, indent=2)
+        if pretty:
+            f.write(json.dumps(dataset, indent=2, default=_json_default))
+        else:
+            _write_compact_json(f, dataset)
 
-    print(f"\nDataset saved to: {output_path}")
+    logger.info("Dataset saved to: %s", output_path)
+
+
+def save_dataset_ndjson(dataset: dict[str, Any], output_dir: str = "data"):
+    """Save dataset as one NDJSON file per section (users/accounts/transactions.ndjson).
+
+    One record per line lets load_data_from_ndjson stream the files in
+    batches instead of parsing a whole dataset-sized JSON document.
+    """
+    directory = Path(output_dir)
+    directory.mkdir(exist_ok=True, parents=True)
+    encode = partial(json.dumps, separators=(",", ":"), default=_json_default)
+
+    for section in _NDJSON_SECTIONS:
+        with open(directory / f"{section}.ndjson", "w") as f:
+            for chunk in batched(dataset[section], _SAVE_CHUNK_SIZE):
+                f.write("".join(f"{encode(record)}\n" for record in chunk))
+
+    logger.info("Dataset saved as NDJSON to: %s", output_dir)
+
+
+def _parse_datetime(value: datetime | str | None) -> datetime | None:
+    """Parse an optional ISO timestamp from dataset JSON (datetimes pass through)"""
+    if value is None or isinstance(value, datetime):
+        return value
+    return datetime.fromisoformat(value)
+
+
+def _user_row(user_data: dict[str, Any]) -> dict[str, Any]:
+    """Convert a dataset user into a users table row"""
+    return {
+        "id": user_data["id"],
+        "name": user_data["name"],
+        "email": user_data["email"],
+        "consent": user_data["consent"],
+        "created_at": _parse_datetime(user_data["created_at"]),
+    }
+
+
+def _account_row(account_data: dict[str, Any]) -> dict[str, Any]:
+    """Convert a dataset account into an accounts table row"""
+    return {
+        "id": account_data["id"],
+        "user_id": account_data["user_id"],
+        "type": account_data["type"],
+        "subtype": account_data["subtype"],
+        "name": account_data["name"],
+        "mask": account_data["mask"],
+        "current_balance": account_data["current_balance"],
+        "available_balance": account_data.get("available_balance"),
+        "limit": account_data.get("limit"),
+        "currency": account_data["currency"],
+        "holder_category": account_data["holder_category"],
+        "apr": account_data.get("apr"),
+        "apr_type": account_data.get("apr_type"),
+        "min_payment": account_data.get("min_payment"),
+        "is_overdue": account_data["is_overdue"],
+        "last_payment_amount": account_data.get("last_payment_amount"),
+        "last_payment_date": _parse_datetime(account_data.get("last_payment_date")),
+        "next_payment_due_date": _parse_datetime(account_data.get("next_payment_due_date")),
+        "last_statement_balance": account_data.get("last_statement_balance"),
+        "last_statement_date": _parse_datetime(account_data.get("last_statement_date")),
+        "interest_rate": account_data.get("interest_rate"),
+    }
+
+
+def _transaction_row(txn_data: TransactionRow | dict[str, Any]) -> dict[str, Any]:
+    """Convert a dataset transaction into a transactions table row"""
+    if isinstance(txn_data, TransactionRow):
+        # Generated rows already carry column names and datetime values
+        return _row_to_dict(txn_data)
+    return {
+        "id": txn_data["id"],
+        "account_id": txn_data["account_id"],
+        "date": _parse_datetime(txn_data["date"]),
+        "amount": txn_data["amount"],
+        "merchant_name": txn_data.get("merchant_name"),
+        "merchant_entity_id": txn_data.get("merchant_entity_id"),
+        "personal_finance_category_primary": txn_data["personal_finance_category_primary"],
+        "personal_finance_category_detailed": txn_data.get("personal_finance_category_detailed"),
+        "payment_channel": txn_data.get("payment_channel"),
+        "pending": txn_data["pending"],
+    }
+
+
+def _read_dataset(json_path: str) -> dict[str, Any]:
+    """Read and parse the dataset JSON file"""
+    return json.loads(Path(json_path).read_bytes())
 
 
 async def load_data_from_json(db: AsyncSession, json_path: str = "data/users.json"):
     """Load synthetic data from JSON file into database"""
-    print(f"Loading data from {json_path}...")
+    logger.info("Loading data from %s...", json_path)
+
+    # Read and parse JSON file in a worker thread so the event loop stays responsive
+    dataset = await asyncio.to_thread(_read_dataset, json_path)
+    await load_dataset(db, dataset)
+
+
+async def load_dataset(db: AsyncSession, dataset: dict[str, Any]):
+    """Load a dataset into the database.
+
+    Accepts a dataset parsed from JSON or returned by generate_dataset, as
+    well as the loader form from _generate_dataset_rows, whose datetimes and
+    transaction rows are inserted as-is without an ISO-string round trip.
+    """
+    await _load_row_batches(db, {
+        User.__table__: _row_batches(dataset["users"], _user_row),
+        Account.__table__: _row_batches(dataset["accounts"], _account_row),
+        Transaction.__table__: _row_batches(dataset["transactions"], _transaction_row),
+    })
+
+
+async def load_data_from_ndjson(db: AsyncSession, data_dir: str = "data"):
+    """Load a dataset saved by save_dataset_ndjson, streaming each file.
+
+    Only one batch of records is held in memory at a time, and file reads
+    happen in a worker thread so the event loop stays responsive.
+    """
+    logger.info("Loading NDJSON data from %s...", data_dir)
+    directory = Path(data_dir)
+    await _load_row_batches(db, {
+        User.__table__: _ndjson_row_batches(directory / "users.ndjson", _user_row),
+        Account.__table__: _ndjson_row_batches(directory / "accounts.ndjson", _account_row),
+        Transaction.__table__: _ndjson_row_batches(directory / "transactions.ndjson", _transaction_row),
+    })
+
 
-    # Read JSON file
-    with open(json_path, "r") as f:
-        dataset = json.load(f)
+async def _row_batches(
+    records: Iterable[Any], to_row: Callable[[Any], dict[str, Any]]
+) -> AsyncIterator[list[dict[str, Any]]]:
+    """Yield in-memory records as table rows, one batch at a time"""
+    for batch in batched(map(to_row, records), _LOAD_BATCH_SIZE):
+        yield list(batch)
 
+
+def _read_ndjson_records(f: TextIO, count: int) -> list[dict[str, Any]]:
+    """Parse up to count records from an open NDJSON file"""
+    return [json.loads(line) for line in islice(f, count)]
+
+
+async def _ndjson_row_batches(
+    path: Path, to_row: Callable[[Any], dict[str, Any]]
+) -> AsyncIterator[list[dict[str, Any]]]:
+    """Yield an NDJSON file's records as table rows, one batch at a time"""
+    with open(path) as f:
+        while records := await asyncio.to_thread(_read_ndjson_records, f, _LOAD_BATCH_SIZE):
+            yield [to_row(record) for record in records]
+
+
+async def _load_row_batches(db: AsyncSession, sources: dict[Any, AsyncIterator[list[dict[str, Any]]]]):
+    """Insert row batches into their tables through the session, committing in chunks
+
+    The session is committed every _LOAD_COMMIT_ROWS rows, so work already
+    pending on it is committed with the first chunk.
+    """
     try:
-        # Create User instances
-        users = []
-        for user_data in dataset["users"]:
-            user = User(
-                id=user_data["id"],
-                name=user_data["name"],
-                email=user_data["email"],
-                consent=user_data["consent"],
-                created_at=datetime.fromisoformat(user_data["created_at"]),
-            )
-            users.append(user)
-
-        # Create Account instances
-        accounts = []
-        for account_data in dataset["accounts"]:
-            account = Account(
-                id=account_data["id"],
-                user_id=account_data["user_id"],
-                type=account_data["type"],
-                subtype=account_data["subtype"],
-                name=account_data["name"],
-                mask=account_data["mask"],
-                current_balance=account_data["current_balance"],
-                available_balance=account_data.get("available_balance"),
-                limit=account_data.get("limit"),
-                currency=account_data["currency"],
-                holder_category=account_data["holder_category"],
-                apr=account_data.get("apr"),
-                apr_type=account_data.get("apr_type"),
-                min_payment=account_data.get("min_payment"),
-                is_overdue=account_data["is_overdue"],
-                last_payment_amount=account_data.get("last_payment_amount"),
-                last_payment_date=datetime.fromisoformat(account_data["last_payment_date"]) if account_data.get("last_payment_date") else None,
-                next_payment_due_date=datetime.fromisoformat(account_data["next_payment_due_date"]) if account_data.get("next_payment_due_date") else None,
-                last_statement_balance=account_data.get("last_statement_balance"),
-                last_statement_date=datetime.fromisoformat(account_data["last_statement_date"]) if account_data.get("last_statement_date") else None,
-                interest_rate=account_data.get("interest_rate"),
-            )
-            accounts.append(account)
-
-        # Create Transaction instances
-        transactions = []
-        for txn_data in dataset["transactions"]:
-            transaction = Transaction(
-                id=txn_data["id"],
-                account_id=txn_data["account_id"],
-                date=datetime.fromisoformat(txn_data["date"]),
-                amount=txn_data["amount"],
-                merchant_name=txn_data.get("merchant_name"),
-                merchant_entity_id=txn_data.get("merchant_entity_id"),
-                personal_finance_category_primary=txn_data["personal_finance_category_primary"],
-                personal_finance_category_detailed=txn_data.get("personal_finance_category_detailed"),
-                payment_channel=txn_data.get("payment_channel"),
-                pending=txn_data["pending"],
-            )
-            transactions.append(transaction)
-
-        # Batch insert all data
-        db.add_all(users)
-        db.add_all(accounts)
-        db.add_all(transactions)
+        # Insert rows in fixed-size executemany batches with plain row dicts;
+        # Core inserts skip the ORM unit-of-work bookkeeping, and sources
+        # produce rows lazily so only one batch is materialized at a time.
+        # Rows whose primary key already exists are skipped, so re-running an
+        # interrupted load resumes it; any other unique violation (e.g. a
+        # duplicate user email) still raises.
+        counts = {}
+        uncommitted_rows = 0
+        for table, batches in sources.items():
+            stmt = insert(table).on_conflict_do_nothing(index_elements=[table.c.id])
+            counts[table.name] = 0
+            async for batch in batches:
+                result = await db.execute(stmt, batch)
+                # rowcount excludes the rows skipped as already present
+                counts[table.name] += result.rowcount
+                uncommitted_rows += len(batch)
+                if uncommitted_rows >= _LOAD_COMMIT_ROWS:
+                    await db.commit()
+                    uncommitted_rows = 0
 
         await db.commit()
 
-        print("\nLoaded into database:")
-        print(f"  - {len(users)} users")
-        print(f"  - {len(accounts)} accounts")
-        print(f"  - {len(transactions)} transactions")
+        logger.info(
+            "Loaded into database: %d users, %d accounts, %d transactions inserted",
+            counts["users"], counts["accounts"], counts["transactions"],
+        )
 
     except Exception as e:
         await db.rollback()
-        print(f"Error loading data: {e}")
+        logger.error("Error loading data: %s", e)
         raise
 
 
-async def main_async(num_users: int = 50, load: bool = False):
+async def main_async(
+    num_users: int = 50, load: bool = False, workers: int | None = None, ndjson: bool = False
+):
     """Async main function for CLI"""
-    # Generate dataset
-    dataset = generate_dataset(num_users)
+    if ndjson:
+        # Stream straight to NDJSON files without holding the dataset in memory
+        generate_dataset_ndjson(num_users, workers=workers)
+        if load:
+            async with AsyncSessionLocal() as db:
+                await load_data_from_ndjson(db)
+        return
+
+    # Generate dataset (loader form, so the load skips parsing ISO strings)
+    dataset = _generate_dataset_rows(num_users, workers)
     save_dataset(dataset)
 
     # Optionally load into database
     if load:
         async with AsyncSessionLocal() as db:
-            await load_data_from_json(db)
+            await load_dataset(db, dataset)
 
 
 def main():
@@ -453,11 +892,29 @@ def main():
         action="store_true",
         help="Load generated data into database",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Worker processes for generation (default: one per CPU)",
+    )
+    parser.add_argument(
+        "--ndjson",
+        action="store_true",
+        help="Stream users/accounts/transactions.ndjson instead of data/users.json",
+    )
 
     args = parser.parse_args()
 
+    # Progress goes through logging; show it on the console like plain prints
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
     # Run async main
-    asyncio.run(main_async(num_users=args.num_users, load=args.load))
+    asyncio.run(
+        main_async(
+            num_users=args.num_users, load=args.load, workers=args.workers, ndjson=args.ndjson
+        )
+    )
 
 
 if __name__ == "__main__":
@@ -6,17 +6,39 @@ between different APR types: purchase, cash_advance, and penalty rates.
 """
 
 import logging
+import re
+from typing import Optional
+
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
 logger = logging.getLogger(__name__)
 
 
-async def check_column_exists(db: AsyncSession, table: str, column: str) -> bool:
-    """Check if a column exists in a table."""
-    result = await db.execute(text(f"PRAGMA table_info({table})"))
-    columns = {row[1] for row in result.fetchall()}
-    return column in columns
+async def load_schema_cache(db: AsyncSession) -> dict[str, str]:
+    """Fetch every table's CREATE TABLE statement in one sqlite_master query."""
+    result = await db.execute(text("SELECT name, sql FROM sqlite_master WHERE type = 'table'"))
+    return {name: sql for name, sql in result.fetchall()}
+
+
+async def check_column_exists(
+    db: AsyncSession, table: str, column: str, schema_cache: Optional[dict[str, str]] = None
+) -> bool:
+    """
+    Check if a column exists in a table.
+
+    Pass a schema_cache from load_schema_cache to check several columns
+    without another round-trip per check.
+    """
+    if schema_cache is None:
+        schema_cache = await load_schema_cache(db)
+    ddl = schema_cache.get(table)
+    if ddl is None:
+        return False
+    # Column definitions follow "(" or "," and may be quoted; ALTER TABLE
+    # ADD COLUMN appends them to the stored DDL in the same form.
+    pattern = rf"[(,]\s*[\"`\[]?{re.escape(column)}[\"`\]]?\s"
+    return re.search(pattern, ddl, re.IGNORECASE) is not None
 
 
 async def migrate(db: AsyncSession) -> None:
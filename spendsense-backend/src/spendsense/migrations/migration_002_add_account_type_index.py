@@ -0,0 +1,66 @@
+"""
+Migration 002: Add (user_id, type) composite index to accounts table
+
+Account lookups filter by user and account type (e.g. a user's credit cards).
+The composite index serves those queries directly instead of scanning every
+account the user owns. Transactions already carry ix_txn_account_date on
+(account_id, date), which SQLite can walk in either direction.
+"""
+
+import logging
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+logger = logging.getLogger(__name__)
+
+
+async def check_index_exists(db: AsyncSession, index: str) -> bool:
+    """Check if an index exists."""
+    result = await db.execute(
+        text("SELECT 1 FROM sqlite_master WHERE type = 'index' AND name = :name"),
+        {"name": index},
+    )
+    return result.first() is not None
+
+
+async def migrate(db: AsyncSession) -> None:
+    """
+    Add ix_accounts_user_id_type index to accounts table.
+    """
+    try:
+        # Check if index already exists
+        if await check_index_exists(db, "ix_accounts_user_id_type"):
+            logger.info("Migration 002: ix_accounts_user_id_type index already exists, skipping")
+            return
+
+        logger.info("Migration 002: Adding ix_accounts_user_id_type index to accounts table...")
+
+        await db.execute(text(
+            "CREATE INDEX ix_accounts_user_id_type ON accounts (user_id, type)"
+        ))
+
+        # Refresh planner statistics so the new index is considered
+        await db.execute(text("ANALYZE accounts"))
+
+        await db.commit()
+
+        logger.info("Migration 002: Successfully added ix_accounts_user_id_type index")
+
+    except Exception as e:
+        logger.error(f"Migration 002 failed: {e}")
+        await db.rollback()
+        raise
+
+
+async def rollback(db: AsyncSession) -> None:
+    """
+    Rollback migration 002.
+    """
+    try:
+        await db.execute(text("DROP INDEX IF EXISTS ix_accounts_user_id_type"))
+        await db.commit()
+        logger.info("Migration 002: Rolled back ix_accounts_user_id_type index")
+    except Exception as e:
+        logger.error(f"Migration 002 rollback failed: {e}")
+        raise
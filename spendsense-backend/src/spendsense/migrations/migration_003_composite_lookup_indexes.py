@@ -0,0 +1,88 @@
+"""
+Migration 003: Replace single-column user_id indexes with composite lookup indexes
+
+Each table is read by user plus a second filter or sort key:
+- personas: latest persona per (user_id, window), by assigned_at DESC
+- feedback: a user's feedback by created_at DESC
+- operator_overrides: a user's overrides by action
+
+The composite indexes serve those queries without a separate sort, and
+their user_id prefix makes the old single-column user_id indexes redundant,
+so those are dropped.
+"""
+
+import logging
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from spendsense.migrations.migration_002_add_account_type_index import (
+    check_index_exists,
+)
+
+logger = logging.getLogger(__name__)
+
+# (new index, CREATE statement, redundant index it replaces, that index's columns)
+INDEXES = [
+    (
+        "ix_personas_user_window_assigned",
+        "CREATE INDEX ix_personas_user_window_assigned ON personas (user_id, window, assigned_at DESC)",
+        "ix_personas_user_id",
+        "personas (user_id)",
+    ),
+    (
+        "ix_feedback_user_created",
+        "CREATE INDEX ix_feedback_user_created ON feedback (user_id, created_at DESC)",
+        "ix_feedback_user_id",
+        "feedback (user_id)",
+    ),
+    (
+        "ix_operator_overrides_user_action",
+        "CREATE INDEX ix_operator_overrides_user_action ON operator_overrides (user_id, action)",
+        "ix_operator_overrides_user_id",
+        "operator_overrides (user_id)",
+    ),
+]
+
+
+async def migrate(db: AsyncSession) -> None:
+    """
+    Create the composite indexes and drop the user_id indexes they replace.
+    """
+    try:
+        for index, create_sql, replaced_index, _ in INDEXES:
+            # Check if index already exists
+            if await check_index_exists(db, index):
+                logger.info(f"Migration 003: {index} index already exists, skipping")
+                continue
+
+            logger.info(f"Migration 003: Adding {index}, replacing {replaced_index}...")
+            await db.execute(text(create_sql))
+            await db.execute(text(f"DROP INDEX IF EXISTS {replaced_index}"))
+
+        # Refresh planner statistics so the new indexes are considered
+        await db.execute(text("ANALYZE"))
+
+        await db.commit()
+
+        logger.info("Migration 003: Successfully added composite lookup indexes")
+
+    except Exception as e:
+        logger.error(f"Migration 003 failed: {e}")
+        await db.rollback()
+        raise
+
+
+async def rollback(db: AsyncSession) -> None:
+    """
+    Rollback migration 003.
+    """
+    try:
+        for index, _, replaced_index, replaced_columns in INDEXES:
+            await db.execute(text(f"CREATE INDEX IF NOT EXISTS {replaced_index} ON {replaced_columns}"))
+            await db.execute(text(f"DROP INDEX IF EXISTS {index}"))
+        await db.commit()
+        logger.info("Migration 003: Rolled back composite lookup indexes")
+    except Exception as e:
+        logger.error(f"Migration 003 rollback failed: {e}")
+        raise
@@ -0,0 +1,78 @@
+"""
+Migration 004: Store categorical columns as small integer codes
+
+personas.persona_type, feedback.feedback_type and operator_overrides.action
+hold one of a handful of values each. They are now written as SMALLINT codes
+(see models.coded_enum.CodedEnum) instead of repeating the text on every row
+and in every index entry.
+
+SQLite cannot change a column's declared type in place, so existing rows are
+rewritten to their codes with an UPDATE ... CASE and the column declaration is
+left as is; CodedEnum reads codes back from either form. Databases created
+from the models after this change get SMALLINT columns directly.
+"""
+
+import logging
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from spendsense.models.feedback import FeedbackType
+from spendsense.models.operator_override import OverrideAction
+from spendsense.models.persona import PERSONA_TYPE_CODES
+
+logger = logging.getLogger(__name__)
+
+# (table, column, stored values in code order). Persona types were stored as
+# their values; the enum columns as member names (SQLAlchemy Enum's default)
+COLUMNS = [
+    ("personas", "persona_type", PERSONA_TYPE_CODES),
+    ("feedback", "feedback_type", [member.name for member in FeedbackType]),
+    ("operator_overrides", "action", [member.name for member in OverrideAction]),
+]
+
+
+def _case(subject: str, pairs, default: str) -> str:
+    """Build a CASE expression mapping each stored value to its replacement."""
+    whens = " ".join(f"WHEN {old} THEN {new}" for old, new in pairs)
+    return f"CASE {subject} {whens} ELSE {default} END"
+
+
+async def migrate(db: AsyncSession) -> None:
+    """
+    Rewrite text values to their integer codes.
+    """
+    try:
+        for table, column, values in COLUMNS:
+            # Enum columns may also hold values written as plain strings
+            pairs = [(f"'{value}'", code) for code, value in enumerate(values)]
+            pairs += [(f"'{value.lower()}'", code) for code, value in enumerate(values) if value != value.lower()]
+
+            logger.info(f"Migration 004: Encoding {table}.{column}...")
+            await db.execute(text(f"UPDATE {table} SET {column} = {_case(column, pairs, column)}"))
+
+        await db.commit()
+
+        logger.info("Migration 004: Successfully encoded categorical columns")
+
+    except Exception as e:
+        logger.error(f"Migration 004 failed: {e}")
+        await db.rollback()
+        raise
+
+
+async def rollback(db: AsyncSession) -> None:
+    """
+    Rollback migration 004.
+    """
+    try:
+        for table, column, values in COLUMNS:
+            # Codes may read back as text or integers depending on column affinity
+            pairs = [(code, f"'{value}'") for code, value in enumerate(values)]
+            case_sql = _case(f"CAST({column} AS INTEGER)", pairs, column)
+            await db.execute(text(f"UPDATE {table} SET {column} = {case_sql} WHERE {column} GLOB '[0-9]*'"))
+        await db.commit()
+        logger.info("Migration 004: Rolled back categorical column codes")
+    except Exception as e:
+        logger.error(f"Migration 004 rollback failed: {e}")
+        raise
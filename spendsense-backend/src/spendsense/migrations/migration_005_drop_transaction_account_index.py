@@ -0,0 +1,56 @@
+"""
+Migration 005: Drop the single-column transactions.account_id index
+
+ix_txn_account_date (account_id, date) already serves every lookup by
+account_id through its leading column, so ix_transactions_account_id only
+costs space and an extra b-tree write per inserted transaction.
+"""
+
+import logging
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from spendsense.migrations.migration_002_add_account_type_index import (
+    check_index_exists,
+)
+
+logger = logging.getLogger(__name__)
+
+
+async def migrate(db: AsyncSession) -> None:
+    """
+    Drop ix_transactions_account_id once the composite index is present.
+    """
+    try:
+        if not await check_index_exists(db, "ix_txn_account_date"):
+            logger.info("Migration 005: ix_txn_account_date missing, keeping ix_transactions_account_id")
+            return
+
+        if not await check_index_exists(db, "ix_transactions_account_id"):
+            logger.info("Migration 005: ix_transactions_account_id already dropped, skipping")
+            return
+
+        logger.info("Migration 005: Dropping ix_transactions_account_id...")
+        await db.execute(text("DROP INDEX ix_transactions_account_id"))
+        await db.commit()
+
+        logger.info("Migration 005: Successfully dropped redundant transactions index")
+
+    except Exception as e:
+        logger.error(f"Migration 005 failed: {e}")
+        await db.rollback()
+        raise
+
+
+async def rollback(db: AsyncSession) -> None:
+    """
+    Rollback migration 005.
+    """
+    try:
+        await db.execute(text("CREATE INDEX IF NOT EXISTS ix_transactions_account_id ON transactions (account_id)"))
+        await db.commit()
+        logger.info("Migration 005: Restored ix_transactions_account_id")
+    except Exception as e:
+        logger.error(f"Migration 005 rollback failed: {e}")
+        raise
@@ -0,0 +1,72 @@
+"""
+Migration 006: Make the personas (user_id, window, assigned_at) index unique
+
+Persona inserts are ON CONFLICT DO NOTHING against this index, so a retried
+assignment with the same timestamp is skipped instead of stored twice. Any
+duplicate rows already present are removed first (keeping the oldest id),
+since SQLite cannot build a unique index over them.
+"""
+
+import logging
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+logger = logging.getLogger(__name__)
+
+INDEX = "ix_personas_user_window_assigned"
+
+
+async def check_index_unique(db: AsyncSession, table: str, index: str) -> bool:
+    """Check if an index exists and is unique."""
+    result = await db.execute(
+        text("SELECT 1 FROM pragma_index_list(:table) WHERE name = :name AND \"unique\" = 1"),
+        {"table": table, "name": index},
+    )
+    return result.first() is not None
+
+
+async def migrate(db: AsyncSession) -> None:
+    """
+    Deduplicate persona assignments and rebuild the lookup index as unique.
+    """
+    try:
+        if await check_index_unique(db, "personas", INDEX):
+            logger.info(f"Migration 006: {INDEX} is already unique, skipping")
+            return
+
+        logger.info("Migration 006: Removing duplicate persona assignments...")
+        await db.execute(text(
+            "DELETE FROM personas WHERE id NOT IN "
+            "(SELECT MIN(id) FROM personas GROUP BY user_id, window, assigned_at)"
+        ))
+
+        logger.info(f"Migration 006: Rebuilding {INDEX} as a unique index...")
+        await db.execute(text(f"DROP INDEX IF EXISTS {INDEX}"))
+        await db.execute(text(
+            f"CREATE UNIQUE INDEX {INDEX} ON personas (user_id, window, assigned_at DESC)"
+        ))
+        await db.commit()
+
+        logger.info("Migration 006: Successfully made persona assignments unique")
+
+    except Exception as e:
+        logger.error(f"Migration 006 failed: {e}")
+        await db.rollback()
+        raise
+
+
+async def rollback(db: AsyncSession) -> None:
+    """
+    Rollback migration 006 (removed duplicate rows are not restored).
+    """
+    try:
+        await db.execute(text(f"DROP INDEX IF EXISTS {INDEX}"))
+        await db.execute(text(
+            f"CREATE INDEX {INDEX} ON personas (user_id, window, assigned_at DESC)"
+        ))
+        await db.commit()
+        logger.info(f"Migration 006: Restored non-unique {INDEX}")
+    except Exception as e:
+        logger.error(f"Migration 006 rollback failed: {e}")
+        raise
@@ -0,0 +1,120 @@
+"""
+Migration 007: Convert existing personas.assigned_at values to UTC
+
+Persona assignments used to be stamped with naive local time and are now
+stamped with naive UTC. SQLite keeps no timezone with the stored text, so
+the (user_id, window, assigned_at DESC) ordering would mix the two clocks
+unless the old rows are shifted.
+
+The offset of the clock that wrote the old rows cannot be recovered from the
+data, and the host running the migration may not be that host, so it is
+never taken from the local timezone: it must be given explicitly
+(PERSONA_LEGACY_UTC_OFFSET_MINUTES, e.g. -300 for UTC-05:00, or 0 when the
+rows were already written in UTC). Without it the migration is skipped.
+
+The stored text does not say which clock wrote a row either, so the
+migration records itself in a data_migrations table and runs only once.
+"""
+
+import logging
+from typing import Optional
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from spendsense.config import settings
+
+logger = logging.getLogger(__name__)
+
+NAME = "007_persona_assigned_at_utc"
+INDEX = "ix_personas_user_window_assigned"
+CREATE_INDEX = f"CREATE UNIQUE INDEX {INDEX} ON personas (user_id, window, assigned_at DESC)"
+
+
+async def check_applied(db: AsyncSession, name: str) -> bool:
+    """Check if a data migration has been recorded in data_migrations."""
+    await db.execute(text(
+        "CREATE TABLE IF NOT EXISTS data_migrations (name TEXT PRIMARY KEY, applied_at TEXT NOT NULL)"
+    ))
+    result = await db.execute(text("SELECT 1 FROM data_migrations WHERE name = :name"), {"name": name})
+    return result.first() is not None
+
+
+async def _shift_assigned_at(db: AsyncSession, minutes: int) -> None:
+    """Add minutes to every assigned_at, keeping microseconds."""
+    # The unique index is dropped for the rewrite: rows are updated one at a
+    # time, so a shifted row could briefly collide with one not yet shifted
+    await db.execute(text(f"DROP INDEX IF EXISTS {INDEX}"))
+    await db.execute(
+        text(
+            "UPDATE personas SET assigned_at = "
+            "strftime('%Y-%m-%d %H:%M:%S', assigned_at, :shift) || substr(assigned_at, 20)"
+        ),
+        {"shift": f"{minutes:+d} minutes"},
+    )
+    await db.execute(text(CREATE_INDEX))
+
+
+async def migrate(db: AsyncSession, source_utc_offset_minutes: Optional[int] = None) -> None:
+    """
+    Convert local-time persona assignment timestamps to UTC.
+
+    Args:
+        db: Async SQLAlchemy database session
+        source_utc_offset_minutes: UTC offset of the clock that wrote the
+            existing rows (default: settings.persona_legacy_utc_offset_minutes)
+    """
+    try:
+        if await check_applied(db, NAME):
+            logger.info("Migration 007: persona timestamps already converted to UTC, skipping")
+            return
+
+        if source_utc_offset_minutes is None:
+            source_utc_offset_minutes = settings.persona_legacy_utc_offset_minutes
+        if source_utc_offset_minutes is None:
+            logger.warning(
+                "Migration 007: PERSONA_LEGACY_UTC_OFFSET_MINUTES is not set, skipping; "
+                "set it to the UTC offset of the host that wrote the existing persona rows"
+            )
+            return
+
+        logger.info(
+            "Migration 007: Converting personas.assigned_at from UTC%+d minutes to UTC...",
+            source_utc_offset_minutes,
+        )
+        await _shift_assigned_at(db, -source_utc_offset_minutes)
+        await db.execute(
+            text("INSERT INTO data_migrations (name, applied_at) VALUES (:name, datetime('now'))"),
+            {"name": NAME},
+        )
+        await db.commit()
+
+        logger.info("Migration 007: Successfully converted persona timestamps to UTC")
+
+    except Exception as e:
+        logger.error(f"Migration 007 failed: {e}")
+        await db.rollback()
+        raise
+
+
+async def rollback(db: AsyncSession, source_utc_offset_minutes: Optional[int] = None) -> None:
+    """
+    Rollback migration 007 (shifts every persona timestamp back to the source offset).
+    """
+    try:
+        if not await check_applied(db, NAME):
+            logger.info("Migration 007: not applied, nothing to roll back")
+            return
+
+        if source_utc_offset_minutes is None:
+            source_utc_offset_minutes = settings.persona_legacy_utc_offset_minutes
+        if source_utc_offset_minutes is None:
+            raise ValueError("PERSONA_LEGACY_UTC_OFFSET_MINUTES is required to roll back migration 007")
+
+        await _shift_assigned_at(db, source_utc_offset_minutes)
+        await db.execute(text("DELETE FROM data_migrations WHERE name = :name"), {"name": NAME})
+        await db.commit()
+        logger.info("Migration 007: Restored local-time persona timestamps")
+    except Exception as e:
+        logger.error(f"Migration 007 rollback failed: {e}")
+        raise
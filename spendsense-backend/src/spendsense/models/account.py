@@ -65,3 +65,4 @@ class Account(Base):
 
 # Create index on user_id for faster queries
 Index("ix_accounts_user_id", Account.user_id)
+Index("ix_accounts_user_id_type", Account.user_id, Account.type)  # Composite index
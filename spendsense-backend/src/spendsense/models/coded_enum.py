@@ -0,0 +1,48 @@
+"""Small-integer column type for categorical values"""
+
+from enum import Enum
+from typing import Any, Optional, Sequence
+
+from sqlalchemy import SmallInteger
+from sqlalchemy.types import TypeDecorator
+
+
+class CodedEnum(TypeDecorator):
+    """
+    Store one of a fixed set of values as its position in that set.
+
+    The column holds a SMALLINT code while Python code keeps reading and
+    writing the values themselves, so comparisons such as
+    ``OperatorOverride.action == "flag"`` are unchanged. Enum members, their
+    values, and their names are all accepted on write; reads return the
+    member (or the plain string for a sequence of strings).
+
+    Codes are positional: only ever append to the value sequence.
+    """
+
+    impl = SmallInteger
+    cache_ok = True
+
+    def __init__(self, values: Sequence[Any]):
+        super().__init__()
+        self.values = tuple(values)
+        self._codes = {}
+        for code, value in enumerate(self.values):
+            self._codes[value] = code
+            if isinstance(value, Enum):
+                self._codes[value.name] = code
+
+    def process_bind_param(self, value: Any, dialect) -> Optional[int]:
+        if value is None:
+            return None
+        try:
+            return self._codes[value]
+        except KeyError:
+            raise ValueError(f"{value!r} is not one of {[str(v) for v in self.values]}") from None
+
+    def process_result_value(self, value: Any, dialect) -> Any:
+        if value is None:
+            return None
+        # int() because SQLite hands back text for codes stored in a column
+        # migrated in place from VARCHAR
+        return self.values[int(value)]
@@ -1,7 +1,7 @@
 """Content model for SpendSense"""
 
 from datetime import datetime
-from sqlalchemy import String, Text, DateTime
+from sqlalchemy import JSON, String, Text, DateTime
 from sqlalchemy.orm import Mapped, mapped_column
 
 from spendsense.database import Base
@@ -18,17 +18,20 @@ class Content(Base):
     )  # 'article', 'video', 'tool'
     title: Mapped[str] = mapped_column(String(200), nullable=False)
     summary: Mapped[str] = mapped_column(String(500), nullable=False)
-    body: Mapped[str] = mapped_column(Text, nullable=False)
-    persona_tags: Mapped[str] = mapped_column(
-        String(500), nullable=False
-    )  # JSON stored as text, list of persona types
-    signal_tags: Mapped[str] = mapped_column(
-        String(500), nullable=False
-    )  # JSON stored as text, list of signal names
+    # Deferred: catalog listings only need the short columns; detail reads
+    # load it with .options(undefer(Content.body)) (lazy loads don't work on
+    # AsyncSession)
+    body: Mapped[str] = mapped_column(Text, nullable=False, deferred=True)
+    persona_tags: Mapped[list[str]] = mapped_column(
+        JSON, nullable=False
+    )  # List of persona types
+    signal_tags: Mapped[list[str]] = mapped_column(
+        JSON, nullable=False
+    )  # List of signal names
     source: Mapped[str] = mapped_column(
         String(50), nullable=False
     )  # 'template', 'llm', 'human'
-    created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
 
     def __repr__(self) -> str:
         return f"<Content(id={self.id}, type={self.type}, title={self.title})>"
@@ -1,11 +1,12 @@
 """Feedback database model"""
 
 from datetime import datetime, timezone
-from sqlalchemy import String, Text, DateTime, Enum as SQLEnum
+from sqlalchemy import String, Text, DateTime, Index, CheckConstraint
 from sqlalchemy.orm import Mapped, mapped_column
 import enum
 
 from spendsense.database import Base
+from spendsense.models.coded_enum import CodedEnum
 
 
 class FeedbackType(str, enum.Enum):
@@ -20,12 +21,15 @@ class FeedbackType(str, enum.Enum):
 class Feedback(Base):
     """User feedback on recommendations and offers"""
     __tablename__ = "feedback"
+    __table_args__ = (
+        CheckConstraint(f"feedback_type BETWEEN 0 AND {len(FeedbackType) - 1}", name="ck_feedback_type_code"),
+    )
 
     id: Mapped[str] = mapped_column(String, primary_key=True)
-    user_id: Mapped[str] = mapped_column(String, nullable=False, index=True)
+    user_id: Mapped[str] = mapped_column(String, nullable=False)
     recommendation_id: Mapped[str] = mapped_column(String, nullable=False, index=True)
     recommendation_type: Mapped[str] = mapped_column(String, nullable=False)  # "education" or "offer"
-    feedback_type: Mapped[str] = mapped_column(SQLEnum(FeedbackType), nullable=False)
+    feedback_type: Mapped[str] = mapped_column(CodedEnum(FeedbackType), nullable=False)  # Stored as SMALLINT code
     comment: Mapped[str] = mapped_column(Text, nullable=True)
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
@@ -35,3 +39,8 @@ class Feedback(Base):
 
     def __repr__(self) -> str:
         return f"<Feedback(id={self.id}, user_id={self.user_id}, feedback_type={self.feedback_type})>"
+
+
+# Composite index for a user's feedback, newest first
+# (WHERE user_id = ? ORDER BY created_at DESC)
+Index("ix_feedback_user_created", Feedback.user_id, Feedback.created_at.desc())
@@ -1,11 +1,12 @@
 """Operator override database model"""
 
 from datetime import datetime, timezone
-from sqlalchemy import String, Text, DateTime, Enum as SQLEnum
+from sqlalchemy import String, Text, DateTime, Index, CheckConstraint
 from sqlalchemy.orm import Mapped, mapped_column
 import enum
 
 from spendsense.database import Base
+from spendsense.models.coded_enum import CodedEnum
 
 
 class OverrideAction(str, enum.Enum):
@@ -17,12 +18,15 @@ class OverrideAction(str, enum.Enum):
 class OperatorOverride(Base):
     """Operator overrides for recommendation quality control"""
     __tablename__ = "operator_overrides"
+    __table_args__ = (
+        CheckConstraint(f"action BETWEEN 0 AND {len(OverrideAction) - 1}", name="ck_operator_overrides_action_code"),
+    )
 
     id: Mapped[str] = mapped_column(String, primary_key=True)
-    user_id: Mapped[str] = mapped_column(String, nullable=False, index=True)
+    user_id: Mapped[str] = mapped_column(String, nullable=False)
     recommendation_id: Mapped[str] = mapped_column(String, nullable=False, index=True)
     recommendation_type: Mapped[str] = mapped_column(String, nullable=False)  # "education" or "offer"
-    action: Mapped[str] = mapped_column(SQLEnum(OverrideAction), nullable=False)
+    action: Mapped[str] = mapped_column(CodedEnum(OverrideAction), nullable=False)  # Stored as SMALLINT code
     reason: Mapped[str] = mapped_column(Text, nullable=True)
     operator_id: Mapped[str] = mapped_column(String, nullable=False, default="system")
     created_at: Mapped[datetime] = mapped_column(
@@ -33,3 +37,8 @@ class OperatorOverride(Base):
 
     def __repr__(self) -> str:
         return f"<OperatorOverride(id={self.id}, action={self.action}, rec_id={self.recommendation_id})>"
+
+
+# Composite index for a user's overrides by action
+# (WHERE user_id = ? AND action = ?)
+Index("ix_operator_overrides_user_action", OperatorOverride.user_id, OperatorOverride.action)
@@ -2,11 +2,12 @@
 
 from datetime import datetime
 from enum import Enum
-from sqlalchemy import String, Integer, Float, DateTime, ForeignKey, Index
+from sqlalchemy import String, Integer, Float, DateTime, ForeignKey, Index, CheckConstraint
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from typing import TYPE_CHECKING
 
 from spendsense.database import Base
+from spendsense.models.coded_enum import CodedEnum
 
 if TYPE_CHECKING:
     from spendsense.models.user import User
@@ -23,10 +24,25 @@ class PersonaType(str, Enum):
     BALANCED = "balanced"  # Default, no specific patterns
 
 
+# Stored code of each persona type: its index here, which follows
+# personas.types.PERSONA_PRIORITY so ordering by code is ordering by urgency
+PERSONA_TYPE_CODES = (
+    PersonaType.HIGH_UTILIZATION.value,
+    PersonaType.VARIABLE_INCOME.value,
+    PersonaType.DEBT_CONSOLIDATOR.value,
+    PersonaType.SUBSCRIPTION_HEAVY.value,
+    PersonaType.SAVINGS_BUILDER.value,
+    PersonaType.BALANCED.value,
+)
+
+
 class Persona(Base):
     """Persona assignment record with confidence scoring"""
 
     __tablename__ = "personas"
+    __table_args__ = (
+        CheckConstraint(f"persona_type BETWEEN 0 AND {len(PERSONA_TYPE_CODES) - 1}", name="ck_personas_persona_type_code"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     user_id: Mapped[str] = mapped_column(
@@ -34,10 +50,10 @@ class Persona(Base):
     )
     window: Mapped[str] = mapped_column(String(10), nullable=False)  # '30d' or '180d'
     persona_type: Mapped[str] = mapped_column(
-        String(50), nullable=False
-    )  # PersonaType enum values
+        CodedEnum(PERSONA_TYPE_CODES), nullable=False
+    )  # PersonaType enum values, stored as SMALLINT codes
     confidence: Mapped[float] = mapped_column(Float, nullable=False)  # 0.0-1.0
-    assigned_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    assigned_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)  # naive UTC
 
     # Relationships
     user: Mapped["User"] = relationship("User", back_populates="personas")
@@ -46,5 +62,14 @@ class Persona(Base):
         return f"<Persona(id={self.id}, user_id={self.user_id}, persona_type={self.persona_type}, confidence={self.confidence})>"
 
 
-# Create index on user_id for faster queries
-Index("ix_personas_user_id", Persona.user_id)
+# Composite index for a user's latest persona per window
+# (WHERE user_id = ? AND window = ? ORDER BY assigned_at DESC); its user_id
+# prefix also serves plain per-user lookups. Unique, so re-inserting the same
+# assignment is a no-op (see personas.assignment.assign_personas_bulk)
+Index(
+    "ix_personas_user_window_assigned",
+    Persona.user_id,
+    Persona.window,
+    Persona.assigned_at.desc(),
+    unique=True,
+)
@@ -1,7 +1,7 @@
 """Transaction model for SpendSense"""
 
 from datetime import datetime
-from sqlalchemy import String, Integer, Boolean, DateTime, ForeignKey, Index
+from sqlalchemy import String, BigInteger, Boolean, DateTime, ForeignKey, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from typing import Optional, TYPE_CHECKING
 
@@ -22,8 +22,8 @@ class Transaction(Base):
     )
     date: Mapped[datetime] = mapped_column(DateTime, nullable=False)
     amount: Mapped[int] = mapped_column(
-        Integer, nullable=False
-    )  # In cents, positive = debit
+        BigInteger, nullable=False
+    )  # In cents, positive = debit; 64-bit so aggregates never overflow
 
     # Plaid merchant fields
     merchant_name: Mapped[Optional[str]] = mapped_column(String(200), nullable=True)
@@ -52,7 +52,7 @@ class Transaction(Base):
         return f"<Transaction(id={self.id}, account_id={self.account_id}, date={self.date}, amount={self.amount})>"
 
 
-# Critical indexes for query performance
-Index("ix_transactions_account_id", Transaction.account_id)
+# Critical indexes for query performance. Per-account lookups use the
+# account_id prefix of the composite index, so no separate account_id index
 Index("ix_transactions_date", Transaction.date)
 Index("ix_txn_account_date", Transaction.account_id, Transaction.date)  # Composite index
@@ -4,12 +4,16 @@ Personas Module - Financial Persona Assignment
 This module provides persona assignment logic based on behavioral signals.
 Personas help categorize users for personalized recommendations.
 
-Main entry point: assign_persona() assigns a persona to a user.
+Main entry point: assign_persona() assigns a persona to a user;
+assign_personas_bulk() assigns personas to many users in one transaction.
 """
 
-from spendsense.personas.types import PERSONA_PRIORITY, CONFIDENCE_SCORES
+from spendsense.personas.types import PERSONA_PRIORITY, PERSONA_RANK, CONFIDENCE_SCORES
 from spendsense.personas.assignment import (
     assign_persona,
+    assign_personas_bulk,
+    PERSONA_CALCULATORS,
+    PERSONA_RANK_ORDER,
     calculate_high_utilization_confidence,
     calculate_variable_income_confidence,
     calculate_subscription_heavy_confidence,
@@ -19,8 +23,12 @@ from spendsense.personas.assignment import (
 
 __all__ = [
     "PERSONA_PRIORITY",
+    "PERSONA_RANK",
     "CONFIDENCE_SCORES",
+    "PERSONA_CALCULATORS",
+    "PERSONA_RANK_ORDER",
     "assign_persona",
+    "assign_personas_bulk",
     "calculate_high_utilization_confidence",
     "calculate_variable_income_confidence",
     "calculate_subscription_heavy_confidence",
@@ -13,17 +13,56 @@ Personas:
 - balanced: Default fallback if no other persona matches
 """
 
-from datetime import datetime
-from typing import Dict, Any
+from bisect import bisect_right
+from datetime import datetime, timezone
+from itertools import batched
+from typing import Callable, Dict, Any, List, Optional, Sequence, Tuple
+from sqlalchemy import SmallInteger, type_coerce
+from sqlalchemy.dialects.sqlite import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 import logging
 
-from spendsense.features import BehaviorSignals, compute_signals
-from spendsense.personas.types import PERSONA_PRIORITY, CONFIDENCE_SCORES
+from spendsense.features import BehaviorSignals, compute_signals_bulk
+from spendsense.personas.types import (
+    PERSONA_PRIORITY,
+    CONFIDENCE_SCORES,
+    UTILIZATION_THRESHOLDS,
+    UTILIZATION_CONFIDENCE,
+    UTILIZATION_LABELS,
+    PAY_GAP_THRESHOLDS,
+    PAY_GAP_CONFIDENCE,
+    PAY_GAP_LABELS,
+    BUFFER_THRESHOLDS,
+    BUFFER_BOOST,
+    BUFFER_LABELS,
+    SUBSCRIPTION_COUNT_THRESHOLDS,
+    SUBSCRIPTION_COUNT_CONFIDENCE,
+    SUBSCRIPTION_SPEND_THRESHOLDS,
+    SUBSCRIPTION_SPEND_BOOST,
+    GROWTH_THRESHOLDS,
+    GROWTH_CONFIDENCE,
+    GROWTH_LABELS,
+    INFLOW_THRESHOLDS,
+    INFLOW_BOOST,
+    DEBT_UTILIZATION_THRESHOLDS,
+    DEBT_UTILIZATION_CONFIDENCE,
+    DEBT_UTILIZATION_LABELS,
+    CARD_COUNT_THRESHOLDS,
+    CARD_COUNT_BOOST,
+    INTEREST_THRESHOLDS,
+    INTEREST_BOOST,
+)
 from spendsense.models.persona import Persona
 
 logger = logging.getLogger(__name__)
 
+# Rows per executemany INSERT when saving persona assignments in bulk
+PERSONA_INSERT_BATCH_SIZE = 500
+
+# SQL expression for a persona row's priority rank, so queries can
+# order_by(PERSONA_RANK_ORDER) to put the most urgent personas first. The
+# stored persona_type code is the rank (see models.persona.PERSONA_TYPE_CODES)
+PERSONA_RANK_ORDER = type_coerce(Persona.persona_type, SmallInteger)
 
 def calculate_high_utilization_confidence(signals: BehaviorSignals) -> float:
     """
@@ -46,39 +85,32 @@ def calculate_high_utilization_confidence(signals: BehaviorSignals) -> float:
     if not credit:
         return 0.0
 
-    confidence = 0.0
-
-    # Primary signal: Utilization level
+    # Fetch each signal once; flags are checked three times, so use a set
     utilization = credit.get("overall_utilization", 0.0)
-    if utilization >= 90.0:
-        confidence = 0.90  # Critical level
-        logger.info(f"High utilization: critical at {utilization:.1f}%")
-    elif utilization >= 80.0:
-        confidence = 0.85  # Very high
-        logger.info(f"High utilization: very high at {utilization:.1f}%")
-    elif utilization >= 70.0:
-        confidence = 0.80  # High
-        logger.info(f"High utilization: high at {utilization:.1f}%")
-    elif utilization >= 50.0:
-        confidence = 0.70  # Moderate concern
-        logger.info(f"High utilization: moderate at {utilization:.1f}%")
-    else:
-        confidence = 0.0  # Below threshold
+    flags = frozenset(credit.get("flags", ()))
+    log_info = logger.isEnabledFor(logging.INFO)
 
-    # Boost confidence for additional warning flags
-    flags = credit.get("flags", [])
+    # Primary signal: Utilization level (0.0 below 50%)
+    level = bisect_right(UTILIZATION_THRESHOLDS, utilization)
+    confidence = UTILIZATION_CONFIDENCE[level]
+    if level and log_info:
+        logger.info("High utilization: %s at %.1f%%", UTILIZATION_LABELS[level], utilization)
 
+    # Boost confidence for additional warning flags
     if "overdue" in flags:
         confidence = min(confidence + 0.10, 0.98)  # Urgent signal
-        logger.info("High utilization boost: overdue payment detected")
+        if log_info:
+            logger.info("High utilization boost: overdue payment detected")
 
     if "interest_charges" in flags:
         confidence = min(confidence + 0.05, 0.98)
-        logger.info("High utilization boost: interest charges detected")
+        if log_info:
+            logger.info("High utilization boost: interest charges detected")
 
     if "minimum_payment_only" in flags:
         confidence = min(confidence + 0.05, 0.98)
-        logger.info("High utilization boost: minimum payment only")
+        if log_info:
+            logger.info("High utilization boost: minimum payment only")
 
     # Ensure minimum confidence if we have any match
     if confidence > 0:
@@ -108,34 +140,30 @@ def calculate_variable_income_confidence(signals: BehaviorSignals) -> float:
     if not income:
         return 0.0
 
-    # Check median pay gap (must be >45 days)
+    # Check median pay gap (must be >45 days) and buffer (must be <1 month)
+    # before any scoring work
     median_gap_days = income.get("median_gap_days", 0)
     if median_gap_days <= 45:
         return 0.0
 
-    # Base confidence from irregularity level
-    if median_gap_days >= 90:
-        confidence = 0.90  # Very irregular (quarterly or worse)
-        logger.info(f"Variable income: very irregular, gap {median_gap_days} days")
-    elif median_gap_days >= 60:
-        confidence = 0.85  # Irregular (bi-monthly)
-        logger.info(f"Variable income: irregular, gap {median_gap_days} days")
-    else:  # 45-60 days
-        confidence = 0.75  # Moderately irregular
-        logger.info(f"Variable income: moderately irregular, gap {median_gap_days} days")
-
-    # Adjust based on buffer tightness (must be <1 month)
     buffer_months = income.get("buffer_months", 0.0)
     if buffer_months >= 1.0:
         return 0.0  # Has sufficient buffer, not a match
 
-    # Boost confidence for very low buffer
-    if buffer_months < 0.25:
-        confidence = min(confidence + 0.10, 0.95)  # Critical buffer
-        logger.info(f"Variable income boost: critical buffer at {buffer_months:.2f} months")
-    elif buffer_months < 0.5:
-        confidence = min(confidence + 0.05, 0.95)  # Low buffer
-        logger.info(f"Variable income boost: low buffer at {buffer_months:.2f} months")
+    log_info = logger.isEnabledFor(logging.INFO)
+
+    # Base confidence from irregularity level (45-60, 60-90, 90+ days)
+    level = bisect_right(PAY_GAP_THRESHOLDS, median_gap_days)
+    confidence = PAY_GAP_CONFIDENCE[level]
+    if log_info:
+        logger.info("Variable income: %s, gap %s days", PAY_GAP_LABELS[level], median_gap_days)
+
+    # Boost confidence for very low buffer (critical <0.25, low <0.5 months)
+    level = bisect_right(BUFFER_THRESHOLDS, buffer_months)
+    if BUFFER_BOOST[level]:
+        confidence = min(confidence + BUFFER_BOOST[level], 0.95)
+        if log_info:
+            logger.info("Variable income boost: %s buffer at %.2f months", BUFFER_LABELS[level], buffer_months)
 
     # Ensure minimum confidence for matches
     confidence = max(confidence, 0.70)
@@ -169,17 +197,6 @@ def calculate_subscription_heavy_confidence(signals: BehaviorSignals) -> float:
     if count < 3:
         return 0.0
 
-    # Base confidence from subscription count
-    if count >= 7:
-        confidence = 0.85  # Very subscription heavy
-        logger.info(f"Subscription heavy: {count} subscriptions")
-    elif count >= 5:
-        confidence = 0.80  # Many subscriptions
-        logger.info(f"Subscription heavy: {count} subscriptions")
-    else:  # 3-4
-        confidence = 0.70  # Moderate subscriptions
-        logger.info(f"Subscription heavy: {count} subscriptions")
-
     # Check monthly recurring spend and percentage
     monthly_spend = subscriptions.get("monthly_recurring_spend", 0)
     percentage = subscriptions.get("percentage_of_spending", 0.0)
@@ -188,17 +205,25 @@ def calculate_subscription_heavy_confidence(signals: BehaviorSignals) -> float:
     if monthly_spend < 5000 and percentage < 10.0:  # $50 = 5000 cents
         return 0.0  # Count alone isn't enough
 
-    # Boost for high monthly spend
-    if monthly_spend >= 20000:  # $200+
-        confidence = min(confidence + 0.08, 0.90)
-        logger.info(f"Subscription boost: high monthly spend ${monthly_spend/100:.2f}")
-    elif monthly_spend >= 10000:  # $100+
-        confidence = min(confidence + 0.05, 0.90)
+    log_info = logger.isEnabledFor(logging.INFO)
+
+    # Base confidence from subscription count (3-4, 5-6, 7+)
+    confidence = SUBSCRIPTION_COUNT_CONFIDENCE[bisect_right(SUBSCRIPTION_COUNT_THRESHOLDS, count)]
+    if log_info:
+        logger.info("Subscription heavy: %s subscriptions", count)
+
+    # Boost for high monthly spend ($100+, $200+)
+    level = bisect_right(SUBSCRIPTION_SPEND_THRESHOLDS, monthly_spend)
+    if level:
+        confidence = min(confidence + SUBSCRIPTION_SPEND_BOOST[level], 0.90)
+        if level == 2 and log_info:
+            logger.info("Subscription boost: high monthly spend $%.2f", monthly_spend / 100)
 
     # Boost for high percentage of total spend
     if percentage >= 20.0:
         confidence = min(confidence + 0.05, 0.90)
-        logger.info(f"Subscription boost: high percentage {percentage:.1f}%")
+        if log_info:
+            logger.info("Subscription boost: high percentage %.1f%%", percentage)
 
     return min(confidence, 0.90)
 
@@ -234,35 +259,32 @@ def calculate_savings_builder_confidence(signals: BehaviorSignals) -> float:
     if growth_rate < 2.0 and monthly_inflow < 20000:  # $200 = 20000 cents
         return 0.0
 
-    # Check credit utilization (must be <30%)
-    if credit:
-        utilization = credit.get("overall_utilization", 0.0)
-        if utilization >= 30.0:
-            return 0.0  # Not a match if high utilization
-
-    # Base confidence from savings behavior
-    if growth_rate >= 5.0:
-        confidence = 0.85  # Excellent growth
-        logger.info(f"Savings builder: excellent growth at {growth_rate:.1f}%")
-    elif growth_rate >= 3.0:
-        confidence = 0.80  # Strong growth
-        logger.info(f"Savings builder: strong growth at {growth_rate:.1f}%")
-    elif growth_rate >= 2.0:
-        confidence = 0.75  # Moderate growth
-        logger.info(f"Savings builder: moderate growth at {growth_rate:.1f}%")
-    else:
-        confidence = 0.70  # Meeting threshold via inflow only
-        logger.info(f"Savings builder: via inflow ${monthly_inflow/100:.2f}/mo")
-
-    # Boost for high monthly inflow
-    if monthly_inflow >= 50000:  # $500+
-        confidence = min(confidence + 0.05, 0.88)
-        logger.info(f"Savings builder boost: high inflow ${monthly_inflow/100:.2f}/mo")
-    elif monthly_inflow >= 30000:  # $300+
-        confidence = min(confidence + 0.03, 0.88)
+    # Check credit utilization (must be <30%); fetched once for both checks
+    utilization = credit.get("overall_utilization", 0.0) if credit else 0.0
+    if utilization >= 30.0:
+        return 0.0  # Not a match if high utilization
+
+    log_info = logger.isEnabledFor(logging.INFO)
+
+    # Base confidence from savings behavior (below 2% growth means the
+    # threshold was met via inflow only)
+    level = bisect_right(GROWTH_THRESHOLDS, growth_rate)
+    confidence = GROWTH_CONFIDENCE[level]
+    if log_info:
+        if level:
+            logger.info("Savings builder: %s growth at %.1f%%", GROWTH_LABELS[level], growth_rate)
+        else:
+            logger.info("Savings builder: via inflow $%.2f/mo", monthly_inflow / 100)
+
+    # Boost for high monthly inflow ($300+, $500+)
+    level = bisect_right(INFLOW_THRESHOLDS, monthly_inflow)
+    if level:
+        confidence = min(confidence + INFLOW_BOOST[level], 0.88)
+        if level == 2 and log_info:
+            logger.info("Savings builder boost: high inflow $%.2f/mo", monthly_inflow / 100)
 
     # Small reduction if utilization is close to threshold
-    if credit and credit.get("overall_utilization", 0.0) >= 20.0:
+    if utilization >= 20.0:
         confidence = max(confidence - 0.05, 0.65)
 
     return min(confidence, 0.88)
@@ -286,8 +308,8 @@ def calculate_debt_consolidator_confidence(signals: BehaviorSignals) -> float:
     credit = signals.credit
     income = signals.income
 
-    # Must have credit data
-    if not credit:
+    # Must have credit data and regular income (ability to consolidate)
+    if not credit or not income:
         return 0.0
 
     # Check utilization is moderate (30-70%)
@@ -295,80 +317,197 @@ def calculate_debt_consolidator_confidence(signals: BehaviorSignals) -> float:
     if utilization < 30.0 or utilization >= 70.0:
         return 0.0
 
-    # Must have 2+ cards with balances
-    per_card = credit.get("per_card", [])
-    cards_with_balance = [c for c in per_card if c.get("balance", 0) > 0]
-    if len(cards_with_balance) < 2:
-        return 0.0
-
     # Must be paying interest (consolidation opportunity)
     monthly_interest = credit.get("monthly_interest", 0)
     if monthly_interest <= 0:
         return 0.0
 
     # Check NOT overdue (responsible borrower)
-    flags = credit.get("flags", [])
-    if "overdue" in flags:
+    if "overdue" in credit.get("flags", ()):
         return 0.0
 
-    # Should have regular income (ability to consolidate)
-    if income:
-        frequency = income.get("frequency", "unknown")
-        if frequency == "unknown":
-            return 0.0
-    else:
-        return 0.0  # Need income data for consolidation
-
-    # Base confidence from utilization level
-    if utilization >= 60.0:
-        confidence = 0.88  # Higher urgency
-        logger.info(f"Debt consolidator: high utilization at {utilization:.1f}%")
-    elif utilization >= 50.0:
-        confidence = 0.85  # Moderate urgency
-        logger.info(f"Debt consolidator: moderate utilization at {utilization:.1f}%")
-    else:  # 30-50%
-        confidence = 0.75  # Lower urgency but opportunity exists
-        logger.info(f"Debt consolidator: opportunity at {utilization:.1f}%")
-
-    # Boost for multiple cards (more complex to manage)
-    if len(cards_with_balance) >= 4:
-        confidence = min(confidence + 0.05, 0.92)
-        logger.info(f"Debt consolidator boost: {len(cards_with_balance)} cards")
-    elif len(cards_with_balance) >= 3:
-        confidence = min(confidence + 0.03, 0.92)
-
-    # Boost for high interest charges (more savings potential)
-    if monthly_interest >= 20000:  # $200/mo
-        confidence = min(confidence + 0.05, 0.92)
-        logger.info(f"Debt consolidator boost: high interest ${monthly_interest/100:.2f}/mo")
-    elif monthly_interest >= 10000:  # $100/mo
-        confidence = min(confidence + 0.03, 0.92)
-
-    logger.info(
-        f"Debt consolidator: {len(cards_with_balance)} cards, "
-        f"{utilization:.1f}% utilization, ${monthly_interest/100:.2f}/mo interest, "
-        f"confidence {confidence:.2f}"
-    )
+    if income.get("frequency", "unknown") == "unknown":
+        return 0.0
+
+    # Must have 2+ cards with balances
+    cards_with_balance = sum(1 for c in credit.get("per_card", ()) if c.get("balance", 0) > 0)
+    if cards_with_balance < 2:
+        return 0.0
+
+    log_info = logger.isEnabledFor(logging.INFO)
+
+    # Base confidence from utilization level (30-50%, 50-60%, 60-70%)
+    level = bisect_right(DEBT_UTILIZATION_THRESHOLDS, utilization)
+    confidence = DEBT_UTILIZATION_CONFIDENCE[level]
+    if log_info:
+        logger.info("Debt consolidator: %s at %.1f%%", DEBT_UTILIZATION_LABELS[level], utilization)
+
+    # Boost for multiple cards (more complex to manage): 3, 4+
+    level = bisect_right(CARD_COUNT_THRESHOLDS, cards_with_balance)
+    if level:
+        confidence = min(confidence + CARD_COUNT_BOOST[level], 0.92)
+        if level == 2 and log_info:
+            logger.info("Debt consolidator boost: %s cards", cards_with_balance)
+
+    # Boost for high interest charges (more savings potential): $100+, $200+/mo
+    level = bisect_right(INTEREST_THRESHOLDS, monthly_interest)
+    if level:
+        confidence = min(confidence + INTEREST_BOOST[level], 0.92)
+        if level == 2 and log_info:
+            logger.info("Debt consolidator boost: high interest $%.2f/mo", monthly_interest / 100)
+
+    if log_info:
+        logger.info(
+            "Debt consolidator: %s cards, %.1f%% utilization, $%.2f/mo interest, confidence %.2f",
+            cards_with_balance, utilization, monthly_interest / 100, confidence
+        )
 
     return min(confidence, 0.92)
 
 
+# Confidence calculator per persona; "balanced" is the fallback and has none
+_CONFIDENCE_CALCULATORS: Dict[str, Callable[[BehaviorSignals], float]] = {
+    "high_utilization": calculate_high_utilization_confidence,
+    "variable_income": calculate_variable_income_confidence,
+    "debt_consolidator": calculate_debt_consolidator_confidence,
+    "subscription_heavy": calculate_subscription_heavy_confidence,
+    "savings_builder": calculate_savings_builder_confidence,
+}
+
+# Calculators in PERSONA_PRIORITY order, the single source of truth for ordering
+PERSONA_CALCULATORS: List[Tuple[str, Callable[[BehaviorSignals], float]]] = [
+    (persona_type, _CONFIDENCE_CALCULATORS[persona_type])
+    for persona_type in PERSONA_PRIORITY
+    if persona_type != "balanced"
+]
+
+
+def _match_persona(signals: BehaviorSignals) -> Tuple[str, float]:
+    """
+    Pick the persona for a set of signals.
+
+    Personas are checked in priority order (most urgent first), using the
+    first with confidence > 0; defaults to "balanced".
+
+    Returns:
+        Tuple of (persona_type, confidence)
+    """
+    # Each function returns a confidence score (0.0-1.0)
+    for persona_type, calculate_confidence in PERSONA_CALCULATORS:
+        confidence = calculate_confidence(signals)
+        if confidence > 0:
+            return persona_type, confidence
+
+    # Default to balanced with base confidence
+    return "balanced", CONFIDENCE_SCORES["balanced"]
+
+
+def _naive_utc(value: datetime) -> datetime:
+    """Convert a timestamp to naive UTC, the form personas.assigned_at is stored in"""
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+async def assign_personas_bulk(
+    db: AsyncSession,
+    user_ids: Sequence[str],
+    window_days: int,
+    assigned_at: Optional[datetime] = None
+) -> List[Dict[str, Any]]:
+    """
+    Assign financial personas to several users in one database transaction.
+
+    Signals are computed with batched queries and personas matched per user
+    in Python; the assignments are then saved with batched executemany INSERTs and a single
+    commit, instead of one INSERT + commit + refresh round-trip per user.
+
+    Inserts are ON CONFLICT DO NOTHING against the unique
+    (user_id, window, assigned_at) index, so retrying a call with the same
+    assigned_at does not store duplicate rows.
+
+    Args:
+        db: Async SQLAlchemy database session
+        user_ids: User identifiers
+        window_days: Number of days to analyze (e.g., 30, 180)
+        assigned_at: Timestamp for every assignment (default: now, per user);
+            pass a fixed value to make retries idempotent. Stored as naive
+            UTC; an aware value is converted, a naive one is taken as UTC
+
+    Returns:
+        List of persona dictionaries (see assign_persona), in user_ids order
+
+    Side Effects:
+        - Saves persona assignments to database (personas table)
+    """
+    logger.info("Assigning personas for %s users, window: %s days", len(user_ids), window_days)
+
+    # Format window string (e.g., "30d", "180d")
+    window_str = f"{window_days}d"
+
+    results = []
+    rows = []
+    # Compute all behavioral signals a batch of users at a time, bounding the
+    # size of the IN lists
+    signals_by_user = {}
+    for user_batch in batched(dict.fromkeys(user_ids), PERSONA_INSERT_BATCH_SIZE):
+        signals_by_user.update(await compute_signals_bulk(db, user_batch, window_days))
+
+    fixed_assigned_at = _naive_utc(assigned_at) if assigned_at is not None else None
+
+    for user_id in user_ids:
+        signals = signals_by_user[user_id]
+        persona_type, confidence = _match_persona(signals)
+        row_assigned_at = fixed_assigned_at or datetime.now(timezone.utc).replace(tzinfo=None)
+
+        logger.info("Assigned persona '%s' to user %s with confidence %s", persona_type, user_id, confidence)
+
+        rows.append({
+            "user_id": user_id,
+            "window": window_str,
+            "persona_type": persona_type,
+            "confidence": confidence,
+            "assigned_at": row_assigned_at
+        })
+        results.append({
+            "persona_type": persona_type,
+            "confidence": confidence,
+            "signals": signals,
+            "assigned_at": row_assigned_at
+        })
+
+    # Save to database in bounded executemany batches, committed once;
+    # assignments already stored are skipped
+    stmt = insert(Persona).on_conflict_do_nothing(index_elements=["user_id", "window", "assigned_at"])
+    for batch in batched(rows, PERSONA_INSERT_BATCH_SIZE):
+        await db.execute(stmt, list(batch))
+    await db.commit()
+
+    logger.info("Saved %s persona assignments to database", len(rows))
+
+    return results
+
+
 async def assign_persona(
     db: AsyncSession,
     user_id: str,
-    window_days: int
+    window_days: int,
+    assigned_at: Optional[datetime] = None
 ) -> Dict[str, Any]:
     """
     Assign a financial persona to a user based on behavioral signals.
 
     Personas are checked in priority order (most urgent first). The first
     matching persona is assigned with its confidence score. If no persona
-    matches, defaults to "balanced".
+    matches, defaults to "balanced". Thin wrapper around assign_personas_bulk.
 
     Args:
         db: Async SQLAlchemy database session
         user_id: User identifier
         window_days: Number of days to analyze (e.g., 30, 180)
+        assigned_at: Timestamp for the assignment (default: now); pass the
+            same value when retrying to store the assignment only once.
+            Stored as naive UTC (see assign_personas_bulk)
 
     Returns:
         Dictionary containing:
@@ -376,7 +515,7 @@ async def assign_persona(
             "persona_type": str,        # Assigned persona type
             "confidence": float,         # Confidence score (0.60-0.95)
             "signals": BehaviorSignals, # All computed signals
-            "assigned_at": datetime     # Timestamp of assignment
+            "assigned_at": datetime     # Timestamp of assignment (naive UTC)
         }
 
     Side Effects:
@@ -385,64 +524,5 @@ async def assign_persona(
     Raises:
         HTTPException: If user not found or database error
     """
-    logger.info(f"Assigning persona for user {user_id}, window: {window_days} days")
-
-    # Compute all behavioral signals
-    signals = await compute_signals(db, user_id, window_days)
-
-    # Check personas in priority order, using first with confidence > 0
-    # Each function returns a confidence score (0.0-1.0)
-    confidence = calculate_high_utilization_confidence(signals)
-    if confidence > 0:
-        persona_type = "high_utilization"
-    else:
-        confidence = calculate_variable_income_confidence(signals)
-        if confidence > 0:
-            persona_type = "variable_income"
-        else:
-            confidence = calculate_debt_consolidator_confidence(signals)
-            if confidence > 0:
-                persona_type = "debt_consolidator"
-            else:
-                confidence = calculate_subscription_heavy_confidence(signals)
-                if confidence > 0:
-                    persona_type = "subscription_heavy"
-                else:
-                    confidence = calculate_savings_builder_confidence(signals)
-                    if confidence > 0:
-                        persona_type = "savings_builder"
-                    else:
-                        # Default to balanced with base confidence
-                        persona_type = "balanced"
-                        confidence = 0.60
-
-    # Format window string (e.g., "30d", "180d")
-    window_str = f"{window_days}d"
-
-    # Create timestamp
-    assigned_at = datetime.now()
-
-    logger.info(f"Assigned persona '{persona_type}' to user {user_id} with confidence {confidence}")
-
-    # Save to database
-    persona = Persona(
-        user_id=user_id,
-        window=window_str,
-        persona_type=persona_type,
-        confidence=confidence,
-        assigned_at=assigned_at
-    )
-
-    db.add(persona)
-    await db.commit()
-    await db.refresh(persona)
-
-    logger.info(f"Saved persona assignment to database: {persona}")
-
-    # Return persona data
-    return {
-        "persona_type": persona_type,
-        "confidence": confidence,
-        "signals": signals,
-        "assigned_at": assigned_at
-    }
+    results = await assign_personas_bulk(db, [user_id], window_days, assigned_at)
+    return results[0]
@@ -1,25 +1,76 @@
 """
 Persona Type Definitions
 
-Defines the persona types, priority order, and confidence scores.
+Defines the persona types, priority order, confidence scores, and the
+threshold brackets used to score each persona.
 """
 
+from types import MappingProxyType
+
 # Persona priority order (most urgent/important first)
-PERSONA_PRIORITY = [
+PERSONA_PRIORITY = (
     "high_utilization",    # Most urgent: >70% utilization OR overdue OR min-payment-only
     "variable_income",     # Cash flow risk: irregular income + low buffer
     "debt_consolidator",   # Opportunity: multiple cards with moderate utilization
     "subscription_heavy",  # Cost optimization: high recurring spend
     "savings_builder",     # Building wealth: positive savings trajectory
     "balanced"             # Default fallback
-]
+)
+
+# Priority rank of each persona (0 = most urgent), for O(1) rank comparisons.
+# Read-only, like the other tables here; PersonaType members work as keys
+PERSONA_RANK = MappingProxyType({persona_type: rank for rank, persona_type in enumerate(PERSONA_PRIORITY)})
 
 # Confidence scores for each persona type
-CONFIDENCE_SCORES = {
+CONFIDENCE_SCORES = MappingProxyType({
     "high_utilization": 0.95,
     "variable_income": 0.90,
     "debt_consolidator": 0.88,
     "subscription_heavy": 0.85,
     "savings_builder": 0.80,
     "balanced": 0.60
-}
+})
+
+# Score ladders as sorted breakpoints plus one value per bracket:
+# VALUES[bisect_right(THRESHOLDS, x)] is the value for the highest threshold
+# that x reaches (x >= threshold), or VALUES[0] below all thresholds.
+
+# High utilization: base confidence (and log label) by overall utilization %
+UTILIZATION_THRESHOLDS = (50.0, 70.0, 80.0, 90.0)
+UTILIZATION_CONFIDENCE = (0.0, 0.70, 0.80, 0.85, 0.90)
+UTILIZATION_LABELS = (None, "moderate", "high", "very high", "critical")
+
+# Variable income: base confidence by median pay gap (days, once above 45)
+PAY_GAP_THRESHOLDS = (60, 90)
+PAY_GAP_CONFIDENCE = (0.75, 0.85, 0.90)
+PAY_GAP_LABELS = ("moderately irregular", "irregular", "very irregular")
+
+# Variable income: boost by buffer months (strictly below 0.25, then 0.5)
+BUFFER_THRESHOLDS = (0.25, 0.5)
+BUFFER_BOOST = (0.10, 0.05, 0.0)
+BUFFER_LABELS = ("critical", "low", None)
+
+# Subscription heavy: base confidence by subscription count (once at least 3),
+# and boost by monthly recurring spend in cents
+SUBSCRIPTION_COUNT_THRESHOLDS = (5, 7)
+SUBSCRIPTION_COUNT_CONFIDENCE = (0.70, 0.80, 0.85)
+SUBSCRIPTION_SPEND_THRESHOLDS = (10000, 20000)
+SUBSCRIPTION_SPEND_BOOST = (0.0, 0.05, 0.08)
+
+# Savings builder: base confidence by growth rate %, and boost by monthly
+# inflow in cents
+GROWTH_THRESHOLDS = (2.0, 3.0, 5.0)
+GROWTH_CONFIDENCE = (0.70, 0.75, 0.80, 0.85)
+GROWTH_LABELS = (None, "moderate", "strong", "excellent")
+INFLOW_THRESHOLDS = (30000, 50000)
+INFLOW_BOOST = (0.0, 0.03, 0.05)
+
+# Debt consolidator: base confidence by utilization % (within 30-70), and
+# boosts by cards carrying a balance and by monthly interest in cents
+DEBT_UTILIZATION_THRESHOLDS = (50.0, 60.0)
+DEBT_UTILIZATION_CONFIDENCE = (0.75, 0.85, 0.88)
+DEBT_UTILIZATION_LABELS = ("opportunity", "moderate utilization", "high utilization")
+CARD_COUNT_THRESHOLDS = (3, 4)
+CARD_COUNT_BOOST = (0.0, 0.03, 0.05)
+INTEREST_THRESHOLDS = (10000, 20000)
+INTEREST_BOOST = (0.0, 0.03, 0.05)
@@ -8,37 +8,55 @@ This module provides the recommendation generation pipeline including:
 - LLM-powered content generation (optional)
 
 Main entry point: StandardRecommendationEngine
+
+Names are resolved lazily (PEP 562): a submodule is imported the first time
+one of its names is accessed, so e.g. importing EducationItem does not load
+the engine or the content generators. The legacy shim names still resolve
+but emit a DeprecationWarning, and are left out of __all__ so that a star
+import does not trigger it.
 """
 
-from spendsense.recommend.types import (
-    EducationItem,
-    PartnerOffer,
-    Rationale,
-    EligibilityRules,
-    ContentGenerator,
-)
-from spendsense.recommend.engine import (
-    Recommendation,
-    OfferRecommendation,
-    RecommendationResult,
-    RecommendationEngine,
-    StandardRecommendationEngine,
-    AIRecommendationEngine,
-)
-from spendsense.recommend.content_selection import TemplateGenerator
-from spendsense.recommend.llm_generation import LLMGenerator
+import importlib
+import warnings
 
-# Backward compatibility aliases
-TemplateContentGenerator = TemplateGenerator
-LLMContentGenerator = LLMGenerator
+# Public name -> submodule that defines it, or (submodule, attribute) when
+# exported under a different name
+_LAZY = {
+    # Types
+    "EducationItem": "spendsense.recommend.types",
+    "PartnerOffer": "spendsense.recommend.types",
+    "Rationale": "spendsense.recommend.types",
+    "EligibilityRules": "spendsense.recommend.types",
+    "ContentGenerator": "spendsense.recommend.types",
+    # Engine
+    "Recommendation": "spendsense.recommend.engine",
+    "OfferRecommendation": "spendsense.recommend.engine",
+    "RecommendationResult": "spendsense.recommend.engine",
+    "RecommendationEngine": "spendsense.recommend.engine",
+    "StandardRecommendationEngine": "spendsense.recommend.engine",
+    "AIRecommendationEngine": "spendsense.recommend.engine",
+    # Content generators
+    "TemplateGenerator": "spendsense.recommend.content_selection",
+    "LLMGenerator": "spendsense.recommend.llm_generation",
+    # Backward compatibility aliases
+    "TemplateContentGenerator": ("spendsense.recommend.content_selection", "TemplateGenerator"),
+    "LLMContentGenerator": ("spendsense.recommend.llm_generation", "LLMGenerator"),
+    # Legacy
+    "generate_recommendations": "spendsense.recommend.legacy",
+    "LegacyRecommendation": ("spendsense.recommend.legacy", "Recommendation"),
+}
 
-# Legacy compatibility
-from spendsense.recommend.legacy import (
-    generate_recommendations,
-    Recommendation as LegacyRecommendation,
-)
+# Legacy shim names -> what to use instead
+_DEPRECATED = {
+    "generate_recommendations": "StandardRecommendationEngine().generate_recommendations",
+    "LegacyRecommendation": "Recommendation and OfferRecommendation",
+}
 
-__all__ = [
+# Names backed by the optional LLM integration; a failed import of these
+# says so instead of surfacing a bare missing-module error
+_LLM_NAMES = frozenset({"LLMGenerator", "LLMContentGenerator"})
+
+__all__ = (
     # Types
     "EducationItem",
     "PartnerOffer",
@@ -55,7 +73,35 @@ __all__ = [
     # Content generators
     "TemplateContentGenerator",
     "LLMContentGenerator",
-    # Legacy
-    "generate_recommendations",
-    "LegacyRecommendation",
-]
+)
+
+# dir() result, sorted once
+_DIR = tuple(sorted(__all__))
+
+
+def __getattr__(name: str):
+    """Import the submodule defining name on first access and cache the value."""
+    try:
+        spec = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    module_path, attr = spec if isinstance(spec, tuple) else (spec, name)
+    if name in _DEPRECATED:
+        warnings.warn(
+            f"{__name__}.{name} is deprecated; use {_DEPRECATED[name]} instead",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+    try:
+        module = importlib.import_module(module_path)
+    except ImportError as e:
+        if name in _LLM_NAMES:
+            raise ImportError(f"{name} requires the optional LLM dependencies: {e}") from e
+        raise
+    value = getattr(module, attr)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return _DIR
@@ -6,9 +6,17 @@ and relevance scoring. It provides explainable, deterministic content selection
 without requiring AI API calls.
 """
 
-import yaml
+from collections import defaultdict
+import functools
+from dataclasses import dataclass
+from bisect import bisect_left, bisect_right
+import heapq
+import mmap
+import operator
+import json
+import os
 import logging
-from typing import List, Dict, Any
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional
 from pathlib import Path
 
 from spendsense.recommend.types import ContentGenerator, EducationItem, Rationale, PartnerOffer, EligibilityRules
@@ -22,6 +30,576 @@ logger = logging.getLogger(__name__)
 DEFAULT_CATALOG_PATH = "data/content_catalog.yaml"
 DEFAULT_OFFERS_CATALOG_PATH = "data/partner_offers_catalog.yaml"
 
+# spendsense-backend directory the default catalog paths are relative to
+_BACKEND_ROOT = Path(__file__).resolve().parents[3]
+
+# Upper bounds of the 1-4 relevance buckets; scores at or above 0.8 are a 5
+RELEVANCE_SCALE_THRESHOLDS = (0.2, 0.4, 0.6, 0.8)
+
+# Credit utilization tag by level (bisect_right over the thresholds)
+SIGNAL_UTILIZATION_THRESHOLDS = (30.0, 50.0, 80.0)
+SIGNAL_UTILIZATION_TAGS = (None, "moderate_utilization_30", "high_utilization_50", "high_utilization_80")
+
+# Credit score estimate: utilization upper bound (inclusive) of each band and
+# the band's (start utilization, score at start, points lost per % above start)
+CREDIT_SCORE_UTILIZATION_THRESHOLDS = (10.0, 30.0, 50.0, 75.0)
+CREDIT_SCORE_BANDS = (
+    (0.0, 850, 11),     # Excellent: 850 at 0%, 740 at 10%
+    (10.0, 739, 3.45),  # Good: 739 at 10%, 670 at 30%
+    (30.0, 669, 4.45),  # Fair: 669 at 30%, 580 at 50%
+    (50.0, 579, 3.16),  # Poor: 579 at 50%, 500 at 75%
+    (75.0, 500, 8),     # Very Poor: 500 at 75%, 300 at 100%
+)
+
+
+def _fmt_cents(cents) -> str:
+    """
+    Format an amount in cents as dollars with thousands separators.
+
+    Integer amounts are formatted with integer math (no float division).
+    Float amounts, which computed signals can produce, keep the float
+    formatting so sub-cent values round exactly as before. Either way the
+    output matches f"${cents / 100:,.2f}".
+
+    Args:
+        cents: Amount in cents
+
+    Returns:
+        Formatted amount, e.g. "$1,234.56"
+    """
+    if not isinstance(cents, int):
+        return f"${cents / 100:,.2f}"
+    sign = "-" if cents < 0 else ""
+    dollars, remainder = divmod(abs(cents), 100)
+    return f"${sign}{dollars:,}.{remainder:02d}"
+
+
+def _read_yaml(path: Path) -> Dict[str, Any]:
+    """
+    Parse a YAML catalog through a read-only memory map.
+
+    The parser pulls its input straight from the mapped pages instead of a
+    Python-side copy of the whole file, which keeps peak memory flat as the
+    catalogs grow. Parsing uses libyaml's CSafeLoader when available.
+
+    yaml is imported here rather than at module scope: with a fresh parse
+    cache (see _read_catalog) the catalogs load without it.
+
+    Args:
+        path: Path to the YAML file
+
+    Returns:
+        Parsed catalog dictionary
+    """
+    import yaml
+
+    # Prefer the libyaml-backed loader (bundled with the PyYAML wheels); fall
+    # back to the pure-Python one where PyYAML was built without libyaml
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+    with open(path, 'rb') as f:
+        # mmap cannot map an empty file; let the parser handle it directly
+        if path.stat().st_size == 0:
+            return yaml.load(f, Loader=loader)
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return yaml.load(mm, Loader=loader)
+
+
+def _read_catalog(path: Path) -> Dict[str, Any]:
+    """
+    Load a YAML catalog through a JSON parse cache stored beside it.
+
+    The cache (<catalog>.cache.json) records the YAML file's mtime and size
+    and is used only while both still match; otherwise the YAML is parsed and
+    the cache rewritten atomically. JSON rather than pickle, since the data
+    directory is writable in deployment and loading the cache must not run
+    code. A cache that cannot be read or written is ignored, so a read-only
+    data directory just falls back to parsing.
+
+    Args:
+        path: Path to the YAML file
+
+    Returns:
+        Parsed catalog dictionary
+    """
+    stat = path.stat()
+    key = [stat.st_mtime_ns, stat.st_size]
+    cache_path = path.with_name(f"{path.stem}.cache.json")
+
+    try:
+        with open(cache_path, 'rb') as f:
+            cached = json.load(f)
+        if isinstance(cached, dict) and cached.get("key") == key and "catalog" in cached:
+            return cached["catalog"]
+    except FileNotFoundError:
+        pass
+    except (OSError, ValueError) as e:
+        logger.debug("Ignoring unreadable catalog cache %s: %s", cache_path, e)
+
+    catalog = _read_yaml(path)
+
+    tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({"key": key, "catalog": catalog}, f, ensure_ascii=False, separators=(",", ":"))
+        os.replace(tmp_path, cache_path)
+    except (OSError, TypeError, ValueError) as e:
+        # TypeError/ValueError: a YAML value JSON cannot represent (e.g. a date)
+        logger.debug("Could not write catalog cache %s: %s", cache_path, e)
+        tmp_path.unlink(missing_ok=True)
+
+    return catalog
+
+
+def _relevance_score(persona_match: bool, signal_matches: int) -> float:
+    """
+    Relevance score shared by _calculate_relevance and the persona scorers.
+
+    Args:
+        persona_match: Whether the item is tagged with the user's persona
+        signal_matches: Number of the item's signal tags the user has
+
+    Returns:
+        Relevance score between 0.0 and 1.0
+    """
+    base = 0.5 if persona_match else 0.0
+    # +0.1 per matching signal tag, capped at +0.5; total capped at 1.0
+    return min(base + min(signal_matches * 0.1, 0.5), 1.0)
+
+
+def _make_persona_scorer(persona_type: str, education_items: List[Dict[str, Any]]):
+    """
+    Build a relevance scorer specialized to one persona and a fixed catalog.
+
+    The catalog and persona universe are fixed once loaded, so persona
+    membership is resolved here and items that can never score above zero
+    (no persona match and no signal tags) are left out. Scores come from
+    _relevance_score, like TemplateGenerator._calculate_relevance.
+
+    Args:
+        persona_type: Persona to specialize for (None for a persona that no
+                      catalog item is tagged with)
+        education_items: Education items with precomputed tag sets
+
+    Returns:
+        Function taking a set of active signal tags and returning a list of
+        (item_index, score) tuples for items with score > 0, in catalog order
+    """
+    candidates = tuple(
+        (index, persona_type in item["_persona_set"], item["_signal_set"])
+        for index, item in enumerate(education_items)
+        if persona_type in item["_persona_set"] or item["_signal_set"]
+    )
+
+    def score(signal_tag_set: FrozenSet[str]) -> List[tuple]:
+        results = []
+        for index, persona_match, item_tags in candidates:
+            matches = len(item_tags & signal_tag_set)
+            if persona_match or matches:
+                results.append((index, _relevance_score(persona_match, matches)))
+        return results
+
+    return score
+
+
+def _signals_key(signals: BehaviorSignals) -> tuple:
+    """
+    Reduce BehaviorSignals to the conditions that decide its signal tags.
+
+    Returns:
+        Hashable tuple of (utilization level, interest charges, overdue,
+        subscription heavy, variable income, stable income, positive savings,
+        low emergency fund)
+    """
+    credit = signals.credit
+    income = signals.income
+    savings = signals.savings
+    flags = credit.get("flags", ()) if credit else ()
+
+    return (
+        bisect_right(SIGNAL_UTILIZATION_THRESHOLDS, credit.get("overall_utilization", 0.0)) if credit else 0,
+        "interest_charges" in flags,
+        "overdue" in flags,
+        bool(signals.subscriptions) and signals.subscriptions.get("count", 0) >= 3,
+        bool(income) and income.get("median_gap_days", 0) > 45,
+        bool(income) and income.get("stability", "unknown") == "stable",
+        bool(savings) and savings.get("monthly_inflow", 0) > 0,
+        bool(savings) and savings.get("buffer_months", 0.0) < 3.0,
+    )
+
+
+@functools.lru_cache(maxsize=128)
+def _signal_tags_for_key(key: tuple) -> FrozenSet[str]:
+    """
+    Build the signal tag set for a _signals_key tuple.
+
+    Memoized: users with the same key share one frozenset, and repeated
+    extraction for the same request is a single cache hit.
+    """
+    (
+        utilization_level, interest_charges, overdue, subscription_heavy,
+        variable_income, stable_income, positive_savings, low_emergency_fund,
+    ) = key
+
+    tags = []
+    if utilization_level:
+        tags.append(SIGNAL_UTILIZATION_TAGS[utilization_level])
+    if interest_charges:
+        tags.append("interest_charges")
+    if overdue:
+        tags.append("overdue")
+    if subscription_heavy:
+        tags.append("subscription_heavy")
+    if variable_income:
+        tags.append("variable_income")
+    if stable_income:
+        tags.append("stable_income")
+    if positive_savings:
+        tags.append("positive_savings")
+    if low_emergency_fund:
+        tags.append("low_emergency_fund")
+    return frozenset(tags)
+
+
+def _add_tag_sets(items: List[Dict[str, Any]]) -> None:
+    """
+    Store frozensets of each catalog item's persona and signal tags on the item.
+
+    Relevance scoring then tests membership against these instead of
+    rebuilding sets from the tag lists for every item on every call.
+
+    Args:
+        items: Education items or partner offers from a catalog
+    """
+    for item in items:
+        item["_persona_set"] = frozenset(item.get("persona_tags", ()))
+        item["_signal_set"] = frozenset(item.get("signal_tags", ()))
+
+
+# Fields every education item in the content catalog must define
+EDUCATION_REQUIRED_FIELDS = ("id", "title", "summary", "body", "cta", "source")
+
+
+@dataclass(slots=True, frozen=True)
+class EducationRow:
+    """A validated education item from the content catalog.
+
+    Built once at catalog load, so generate_education reads attributes
+    instead of dict keys and a malformed catalog fails at load rather than
+    on a user request.
+    """
+    id: str
+    title: str
+    summary: str
+    body: str
+    cta: str
+    source: str
+    persona_set: FrozenSet[str]
+    signal_set: FrozenSet[str]
+
+
+def _education_rows(education_items: List[Dict[str, Any]]) -> tuple:
+    """
+    Validate education items and convert them to EducationRows.
+
+    Args:
+        education_items: Education items with precomputed tag sets
+
+    Returns:
+        Tuple of EducationRow, in catalog order
+
+    Raises:
+        ValueError: If an item is missing a required field
+    """
+    rows = []
+    for index, item in enumerate(education_items):
+        missing = [field for field in EDUCATION_REQUIRED_FIELDS if item.get(field) is None]
+        if missing:
+            raise ValueError(
+                f"Education item {item.get('id', f'#{index}')!r} is missing required fields: {missing}"
+            )
+        rows.append(EducationRow(
+            *(item[field] for field in EDUCATION_REQUIRED_FIELDS),
+            persona_set=item["_persona_set"],
+            signal_set=item["_signal_set"],
+        ))
+    return tuple(rows)
+
+
+# List-valued eligibility rules and the key each rule's frozenset is stored
+# under at load time (see _add_rule_sets)
+_RULE_SET_KEYS = (
+    ("required_account_types", "_required_account_types"),
+    ("excluded_account_subtypes", "_excluded_account_subtypes"),
+    ("required_signals", "_required_signals"),
+    ("excluded_signals", "_excluded_signals"),
+)
+
+
+def _add_rule_sets(offers: List[Dict[str, Any]]) -> None:
+    """
+    Store each offer's list-valued eligibility rules as frozensets.
+
+    Eligibility checks then become single subset/disjoint tests. Offers
+    without eligibility rules get an empty rules dict.
+
+    Args:
+        offers: Partner offers from a catalog
+    """
+    for offer in offers:
+        rules = offer.get("eligibility_rules") or {}
+        for rule, key in _RULE_SET_KEYS:
+            rules[key] = frozenset(rules.get(rule) or ())
+        offer["eligibility_rules"] = rules
+
+
+@functools.lru_cache(maxsize=8)
+def _load_content_catalog(path_str: str):
+    """
+    Load a content catalog and compile its persona scorers, once per process.
+
+    Cached by resolved path so every TemplateGenerator reading the same file
+    shares one parse and one set of persona scorers.
+
+    Args:
+        path_str: Resolved path to the content catalog
+
+    Returns:
+        Tuple of (catalog, persona_scorers, education_rows); persona_scorers
+        has one scorer per persona tagged in the catalog, plus a None
+        entry for personas no item is tagged with, and education_rows holds
+        the validated items in catalog order
+
+    Raises:
+        ValueError: If an education item is missing a required field
+    """
+    logger.info("Loading content catalog from %s", path_str)
+
+    catalog = _read_catalog(Path(path_str))
+
+    education_items = catalog.get("education", [])
+    _add_tag_sets(education_items)
+    education_rows = _education_rows(education_items)
+    personas = {p for item in education_items for p in item["_persona_set"]}
+    persona_scorers = {
+        persona: _make_persona_scorer(persona, education_items)
+        for persona in [None, *sorted(personas)]
+    }
+
+    logger.info("Loaded %d education items from catalog", len(education_items))
+    return catalog, persona_scorers, education_rows
+
+
+@functools.lru_cache(maxsize=8)
+def _load_partner_offers_catalog(path_str: str):
+    """
+    Load a partner offers catalog, once per process.
+
+    Args:
+        path_str: Resolved path to the partner offers catalog
+
+    Returns:
+        Tuple of (catalog, offers_by_persona); offers_by_persona maps each
+        persona tag to the offers tagged with it, in catalog order
+    """
+    logger.info("Loading partner offers catalog from %s", path_str)
+
+    catalog = _read_catalog(Path(path_str))
+    offers = catalog.get("partner_offers", [])
+    _add_tag_sets(offers)
+    _add_rule_sets(offers)
+
+    offers_by_persona = defaultdict(list)
+    for offer in offers:
+        for persona in offer["_persona_set"]:
+            offers_by_persona[persona].append(offer)
+
+    logger.info("Loaded %d partner offers from catalog", len(offers))
+    return catalog, dict(offers_by_persona)
+
+
+# Persona explanation handlers. Each takes (signals, signal_tags) and returns
+# the rationale text; dispatched by TemplateGenerator._generate_explanation.
+
+def _explain_high_utilization(signals: BehaviorSignals, signal_tags: FrozenSet[str]) -> str:
+    credit = signals.credit or {}
+    utilization = credit.get("overall_utilization", 0.0)
+    total_balance = credit.get("total_balance", 0)
+    total_limit = credit.get("total_limit", 0)
+
+    parts = [
+        (
+            f"You've been identified as a High Utilization user because your credit card "
+            f"utilization is {utilization:.1f}%, which is above the recommended 30% threshold. "
+            f"You're currently using {_fmt_cents(total_balance)} of your {_fmt_cents(total_limit)} total credit limit. "
+        )
+    ]
+
+    flags = credit.get("flags", [])
+    if "interest_charges" in flags:
+        parts.append("You're also paying interest charges on your balances, which adds to the cost of carrying debt. ")
+    if "overdue" in flags:
+        parts.append("Additionally, you have overdue payments, which can negatively impact your credit score. ")
+
+    parts.append(
+        "High credit utilization can hurt your credit score and lead to higher interest costs. "
+        "We recommend focusing on paying down high balances and keeping utilization below 30%."
+    )
+    # Build the explanation in one join rather than repeated string concatenation
+    return "".join(parts)
+
+
+def _explain_variable_income(signals: BehaviorSignals, signal_tags: FrozenSet[str]) -> str:
+    income = signals.income or {}
+    median_gap = income.get("median_gap_days", 0)
+    buffer_months = income.get("buffer_months", 0.0)
+    avg_amount = income.get("average_amount", 0)
+
+    return (
+        f"You've been identified as a Variable Income user because your income arrives irregularly, "
+        f"with a median gap of {median_gap} days between payments. Your average income payment is "
+        f"{_fmt_cents(avg_amount)}, and you currently have {buffer_months:.1f} months of cash flow buffer. "
+        f"Variable income requires special budgeting strategies and a larger emergency fund. "
+        f"We recommend building your buffer to at least 6-12 months of expenses and using "
+        f"percentage-based budgeting rather than fixed amounts."
+    )
+
+
+def _explain_subscription_heavy(signals: BehaviorSignals, signal_tags: FrozenSet[str]) -> str:
+    subscriptions = signals.subscriptions or {}
+    count = subscriptions.get("count", 0)
+    monthly_spend = subscriptions.get("monthly_recurring_spend", 0)
+    percentage = subscriptions.get("percentage_of_spending", 0.0)
+
+    return (
+        f"You've been identified as a Subscription Heavy user because you have {count} active "
+        f"recurring subscriptions totaling {_fmt_cents(monthly_spend)} per month. This represents "
+        f"{percentage:.1f}% of your total spending. While some subscriptions provide value, "
+        f"it's easy for unused subscriptions to accumulate. We recommend conducting a subscription "
+        f"audit to identify services you rarely use and canceling or downgrading them to save money."
+    )
+
+
+def _explain_savings_builder(signals: BehaviorSignals, signal_tags: FrozenSet[str]) -> str:
+    savings = signals.savings or {}
+    growth_rate = savings.get("growth_rate", 0.0)
+    monthly_inflow = savings.get("monthly_inflow", 0)
+    credit = signals.credit or {}
+    utilization = credit.get("overall_utilization", 0.0)
+
+    return (
+        f"You've been identified as a Savings Builder because you're making consistent progress "
+        f"toward your financial goals. Your savings are growing at {growth_rate:.1f}% with an average "
+        f"monthly inflow of {_fmt_cents(monthly_inflow)}. Your credit utilization is {utilization:.1f}%, "
+        f"which is in a healthy range. Keep up the great work! We recommend focusing on building your "
+        f"emergency fund, automating your savings, and optimizing your investment strategy."
+    )
+
+
+def _explain_balanced(signals: BehaviorSignals, signal_tags: FrozenSet[str]) -> str:
+    parts = [
+        (
+            "You've been identified as a Balanced user, which means you're generally maintaining "
+            "healthy financial habits without critical issues requiring immediate attention. "
+        )
+    ]
+
+    # Add specific insights based on available signals
+    insights = []
+
+    if signals.credit:
+        utilization = signals.credit.get("overall_utilization", 0.0)
+        if utilization < 30:
+            insights.append(f"your credit utilization of {utilization:.1f}% is in a healthy range")
+
+    if signals.income:
+        stability = signals.income.get("stability", "unknown")
+        if stability == "stable":
+            insights.append("you have stable, regular income")
+
+    if signals.savings:
+        monthly_inflow = signals.savings.get("monthly_inflow", 0)
+        if monthly_inflow > 0:
+            insights.append(f"you're saving consistently with {_fmt_cents(monthly_inflow)} monthly inflow")
+
+    if insights:
+        parts.append("Specifically, " + ", and ".join(insights) + ". ")
+
+    parts.append(
+        "Continue monitoring your financial wellness and consider setting specific goals "
+        "to optimize your savings, reduce debt, or build wealth."
+    )
+    return "".join(parts)
+
+
+# Persona -> explanation handler; personas not listed use _explain_balanced
+_EXPLANATION_HANDLERS = {
+    "high_utilization": _explain_high_utilization,
+    "variable_income": _explain_variable_income,
+    "subscription_heavy": _explain_subscription_heavy,
+    "savings_builder": _explain_savings_builder,
+    "balanced": _explain_balanced,
+}
+
+
+# Content explanation handlers: the one-sentence, data-driven variant shown
+# with each education item. A handler returns None when the signals it
+# quotes are missing, and the caller falls back to the generic sentence.
+
+def _content_high_utilization(signals: BehaviorSignals, signal_tags: FrozenSet[str]) -> Optional[str]:
+    if not signals.credit:
+        return None
+    utilization = signals.credit.get("overall_utilization", 0.0)
+    total_balance = signals.credit.get("total_balance", 0) / 100
+    interest = ", and you're paying interest charges" if "interest_charges" in signal_tags else ""
+    return (
+        f"Your credit utilization is {utilization:.1f}% with ${total_balance:,.0f} in balances"
+        f"{interest}."
+    )
+
+
+def _content_subscription_heavy(signals: BehaviorSignals, signal_tags: FrozenSet[str]) -> Optional[str]:
+    if not signals.subscriptions:
+        return None
+    count = signals.subscriptions.get("count", 0)
+    monthly_spend = signals.subscriptions.get("monthly_recurring_spend", 0) / 100
+    return f"You have {count} recurring subscriptions totaling ${monthly_spend:,.0f}/month."
+
+
+def _content_variable_income(signals: BehaviorSignals, signal_tags: FrozenSet[str]) -> Optional[str]:
+    if not signals.income:
+        return None
+    median_gap = signals.income.get("median_gap_days", 0)
+    buffer_months = signals.income.get("buffer_months", 0.0)
+    return f"Your income arrives every {median_gap} days with {buffer_months:.1f} months buffer."
+
+
+def _content_savings_builder(signals: BehaviorSignals, signal_tags: FrozenSet[str]) -> Optional[str]:
+    if not signals.savings:
+        return None
+    monthly_inflow = signals.savings.get("monthly_inflow", 0) / 100
+    growth_rate = signals.savings.get("growth_rate", 0.0)
+    return f"You're saving ${monthly_inflow:,.0f}/month with {growth_rate:.1f}% growth."
+
+
+def _content_debt_consolidator(signals: BehaviorSignals, signal_tags: FrozenSet[str]) -> Optional[str]:
+    if not signals.credit:
+        return None
+    utilization = signals.credit.get("overall_utilization", 0.0)
+    return f"You're managing multiple cards at {utilization:.1f}% utilization."
+
+
+# Persona -> content explanation handler (balanced has none: it always gets
+# the fallback sentence)
+_CONTENT_EXPLANATION_HANDLERS = {
+    "high_utilization": _content_high_utilization,
+    "subscription_heavy": _content_subscription_heavy,
+    "variable_income": _content_variable_income,
+    "savings_builder": _content_savings_builder,
+    "debt_consolidator": _content_debt_consolidator,
+}
+_CONTENT_EXPLANATION_FALLBACK = "This matches your current financial profile."
+
 
 class TemplateGenerator(ContentGenerator):
     """
@@ -40,25 +618,29 @@ class TemplateGenerator(ContentGenerator):
                          relative to the spendsense-backend directory.
             offers_catalog_path: Path to partner_offers_catalog.yaml file. If None, uses default path.
         """
-        backend_root = Path(__file__).parent.parent.parent.parent
-
         if catalog_path is None:
-            catalog_path = backend_root / DEFAULT_CATALOG_PATH
+            catalog_path = _BACKEND_ROOT / DEFAULT_CATALOG_PATH
 
         if offers_catalog_path is None:
-            offers_catalog_path = backend_root / DEFAULT_OFFERS_CATALOG_PATH
+            offers_catalog_path = _BACKEND_ROOT / DEFAULT_OFFERS_CATALOG_PATH
 
-        self.catalog_path = Path(catalog_path)
-        self.offers_catalog_path = Path(offers_catalog_path)
+        self.catalog_path = catalog_path if isinstance(catalog_path, Path) else Path(catalog_path)
+        self.offers_catalog_path = (
+            offers_catalog_path if isinstance(offers_catalog_path, Path) else Path(offers_catalog_path)
+        )
         self._catalog_cache = None
         self._offers_catalog_cache = None
+        self._persona_scorers = {}
+        self._education_rows = ()
+        self._offers_by_persona = {}
         logger.info(f"Initialized TemplateGenerator with catalog: {self.catalog_path}, offers: {self.offers_catalog_path}")
 
     def _load_catalog(self) -> Dict[str, Any]:
         """
         Load content catalog from YAML file.
 
-        Uses caching to avoid reloading on every call.
+        Parsed once per process (see _load_content_catalog) and then cached on
+        the instance.
 
         Returns:
             Dictionary containing 'education' list with content items
@@ -73,17 +655,12 @@ class TemplateGenerator(ContentGenerator):
         if not self.catalog_path.exists():
             raise FileNotFoundError(f"Content catalog not found: {self.catalog_path}")
 
-        logger.info(f"Loading content catalog from {self.catalog_path}")
-
-        with open(self.catalog_path, 'r') as f:
-            catalog = yaml.safe_load(f)
-
+        catalog, self._persona_scorers, self._education_rows = _load_content_catalog(str(self.catalog_path.resolve()))
         self._catalog_cache = catalog
-        logger.info(f"Loaded {len(catalog.get('education', []))} education items from catalog")
 
         return catalog
 
-    def _extract_signal_tags(self, signals: BehaviorSignals) -> List[str]:
+    def _extract_signal_tags(self, signals: BehaviorSignals) -> FrozenSet[str]:
         """
         Extract active signal tags from BehaviorSignals object.
 
@@ -94,54 +671,11 @@ class TemplateGenerator(ContentGenerator):
             signals: BehaviorSignals object with computed user data
 
         Returns:
-            List of active signal tag strings
+            Frozenset of active signal tag strings, so callers test membership
+            and intersect with catalog tag sets without converting
         """
-        tags = []
-
-        # Credit utilization tags
-        if signals.credit:
-            utilization = signals.credit.get("overall_utilization", 0.0)
-            if utilization >= 80.0:
-                tags.append("high_utilization_80")
-            elif utilization >= 50.0:
-                tags.append("high_utilization_50")
-            elif utilization >= 30.0:
-                tags.append("moderate_utilization_30")
-
-            # Credit flags
-            flags = signals.credit.get("flags", [])
-            if "interest_charges" in flags:
-                tags.append("interest_charges")
-            if "overdue" in flags:
-                tags.append("overdue")
-
-        # Subscription tags
-        if signals.subscriptions:
-            count = signals.subscriptions.get("count", 0)
-            if count >= 3:
-                tags.append("subscription_heavy")
-
-        # Income tags
-        if signals.income:
-            median_gap = signals.income.get("median_gap_days", 0)
-            if median_gap > 45:
-                tags.append("variable_income")
-
-            stability = signals.income.get("stability", "unknown")
-            if stability == "stable":
-                tags.append("stable_income")
-
-        # Savings tags
-        if signals.savings:
-            monthly_inflow = signals.savings.get("monthly_inflow", 0)
-            if monthly_inflow > 0:
-                tags.append("positive_savings")
-
-            buffer_months = signals.savings.get("buffer_months", 0.0)
-            if buffer_months < 3.0:
-                tags.append("low_emergency_fund")
-
-        logger.debug(f"Extracted signal tags: {tags}")
+        tags = _signal_tags_for_key(_signals_key(signals))
+        logger.debug("Extracted signal tags: %s", tags)
         return tags
 
     def _convert_to_1_to_5_scale(self, match_score: float) -> int:
@@ -161,22 +695,13 @@ class TemplateGenerator(ContentGenerator):
         Returns:
             Integer score between 1 and 5
         """
-        if match_score < 0.2:
-            return 1
-        elif match_score < 0.4:
-            return 2
-        elif match_score < 0.6:
-            return 3
-        elif match_score < 0.8:
-            return 4
-        else:
-            return 5
+        return bisect_right(RELEVANCE_SCALE_THRESHOLDS, match_score) + 1
 
     def _calculate_relevance(
         self,
         content_item: Dict[str, Any],
         persona_type: str,
-        signal_tags: List[str]
+        signal_tags: Iterable[str]
     ) -> float:
         """
         Calculate relevance score for a content item.
@@ -187,34 +712,26 @@ class TemplateGenerator(ContentGenerator):
         3. Final score capped at 1.0
 
         Args:
-            content_item: Dictionary from content catalog with persona_tags and signal_tags
+            content_item: Item from a loaded catalog (with precomputed tag sets)
             persona_type: User's assigned persona
-            signal_tags: List of active signal tags for the user
+            signal_tags: Active signal tags for the user
 
         Returns:
             Relevance score between 0.0 and 1.0
         """
-        score = 0.0
-
-        # Check persona match
-        content_personas = content_item.get("persona_tags", [])
-        if persona_type in content_personas:
-            score += 0.5
-
-        # Check signal tag matches
-        content_signals = content_item.get("signal_tags", [])
-        matching_signals = set(signal_tags) & set(content_signals)
-        signal_bonus = len(matching_signals) * 0.1
-        score += min(signal_bonus, 0.5)  # Cap signal bonus at 0.5
-
-        # Cap total score at 1.0
-        score = min(score, 1.0)
-
-        logger.debug(
-            f"Relevance score for '{content_item.get('id')}': {score:.2f} "
-            f"(persona_match: {persona_type in content_personas}, "
-            f"signal_matches: {len(matching_signals)})"
-        )
+        # Check persona and signal tag matches
+        content_personas = content_item["_persona_set"]
+        matching_signals = content_item["_signal_set"].intersection(signal_tags)
+        score = _relevance_score(persona_type in content_personas, len(matching_signals))
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Relevance score for '%s': %.2f (persona_match: %s, signal_matches: %d)",
+                content_item.get('id'),
+                score,
+                persona_type in content_personas,
+                len(matching_signals)
+            )
 
         return score
 
@@ -223,6 +740,19 @@ class TemplateGenerator(ContentGenerator):
         persona_type: str,
         signals: BehaviorSignals,
         limit: int = 3
+    ) -> List[EducationItem]:
+        """ContentGenerator entry point; the work is synchronous (_generate_education_sync)."""
+        return self._generate_education_sync(
+            persona_type=persona_type,
+            signals=signals,
+            limit=limit
+        )
+
+    def _generate_education_sync(
+        self,
+        persona_type: str,
+        signals: BehaviorSignals,
+        limit: int = 3
     ) -> List[EducationItem]:
         """
         Generate personalized educational content items.
@@ -232,8 +762,8 @@ class TemplateGenerator(ContentGenerator):
         2. Extract active signal tags from user signals
         3. Calculate relevance score for each content item
         4. Filter items with score > 0
-        5. Sort by relevance (highest first)
-        6. Return top N items
+        5. Select the top N by relevance (highest first)
+        6. Return them as EducationItems
 
         Args:
             persona_type: User's assigned persona (e.g., 'high_utilization')
@@ -255,9 +785,9 @@ class TemplateGenerator(ContentGenerator):
         if signals is None:
             raise ValueError("signals are required")
 
-        # Load catalog
-        catalog = self._load_catalog()
-        education_items = catalog.get("education", [])
+        # Load catalog (validated rows, in catalog order)
+        self._load_catalog()
+        education_items = self._education_rows
 
         if not education_items:
             logger.warning("No education items found in catalog")
@@ -266,15 +796,10 @@ class TemplateGenerator(ContentGenerator):
         # Extract active signal tags
         signal_tags = self._extract_signal_tags(signals)
 
-        # Score and filter content items
-        scored_items = []
-        zero_score_count = 0
-        for item in education_items:
-            score = self._calculate_relevance(item, persona_type, signal_tags)
-            if score > 0:
-                scored_items.append((score, item))
-            else:
-                zero_score_count += 1
+        # Score and filter content items with the persona's scorer
+        scorer = self._persona_scorers.get(persona_type) or self._persona_scorers[None]
+        scored_items = [(score, education_items[i]) for i, score in scorer(signal_tags)]
+        zero_score_count = len(education_items) - len(scored_items)
 
         # Decision trace: Items filtered out by zero score
         if zero_score_count > 0:
@@ -283,8 +808,8 @@ class TemplateGenerator(ContentGenerator):
                 f"(zero relevance score)"
             )
 
-        # Sort by score (highest first)
-        scored_items.sort(key=lambda x: x[0], reverse=True)
+        # Keep the top N by score (highest first, ties in catalog order)
+        top_items = heapq.nlargest(limit, scored_items, key=operator.itemgetter(0))
 
         # Decision trace: Items ranked but not selected
         if len(scored_items) > limit:
@@ -295,14 +820,14 @@ class TemplateGenerator(ContentGenerator):
 
         # Convert to EducationItem objects (top N)
         result = []
-        for score, item in scored_items[:limit]:
+        for score, row in top_items:
             education_item = EducationItem(
-                id=item["id"],
-                title=item["title"],
-                summary=item["summary"],
-                body=item["body"],
-                cta=item["cta"],
-                source=item["source"],
+                id=row.id,
+                title=row.title,
+                summary=row.summary,
+                body=row.body,
+                cta=row.cta,
+                source=row.source,
                 relevance_score=self._convert_to_1_to_5_scale(score)
             )
             result.append(education_item)
@@ -315,6 +840,19 @@ class TemplateGenerator(ContentGenerator):
         persona_type: str,
         confidence: float,
         signals: BehaviorSignals
+    ) -> Rationale:
+        """ContentGenerator entry point; the work is synchronous (_generate_rationale_sync)."""
+        return self._generate_rationale_sync(
+            persona_type=persona_type,
+            confidence=confidence,
+            signals=signals
+        )
+
+    def _generate_rationale_sync(
+        self,
+        persona_type: str,
+        confidence: float,
+        signals: BehaviorSignals
     ) -> Rationale:
         """
         Generate explainable rationale for persona assignment.
@@ -368,7 +906,7 @@ class TemplateGenerator(ContentGenerator):
             persona_type=persona_type,
             confidence=confidence,
             explanation=explanation,
-            key_signals=signal_tags
+            key_signals=sorted(signal_tags)
         )
 
         logger.info(f"Generated rationale: {len(explanation)} chars, {len(signal_tags)} signals")
@@ -380,6 +918,21 @@ class TemplateGenerator(ContentGenerator):
         persona_type: str,
         confidence: float,
         signals: BehaviorSignals
+    ) -> Rationale:
+        """ContentGenerator entry point; the work is synchronous (_generate_content_rationale_sync)."""
+        return self._generate_content_rationale_sync(
+            content_item=content_item,
+            persona_type=persona_type,
+            confidence=confidence,
+            signals=signals
+        )
+
+    def _generate_content_rationale_sync(
+        self,
+        content_item: EducationItem,
+        persona_type: str,
+        confidence: float,
+        signals: BehaviorSignals
     ) -> Rationale:
         """
         Generate explainable rationale specific to a content item.
@@ -434,7 +987,7 @@ class TemplateGenerator(ContentGenerator):
             persona_type=persona_type,
             confidence=confidence,
             explanation=explanation,
-            key_signals=signal_tags
+            key_signals=sorted(signal_tags)
         )
 
         logger.info(f"Generated content-specific rationale: {len(explanation)} chars")
@@ -444,190 +997,60 @@ class TemplateGenerator(ContentGenerator):
         self,
         persona_type: str,
         signals: BehaviorSignals,
-        signal_tags: List[str]
+        signal_tags: FrozenSet[str]
     ) -> str:
         """
         Generate persona-specific explanation text with concrete data points.
 
+        Dispatches through _EXPLANATION_HANDLERS; unknown personas get the
+        balanced explanation.
+
         Args:
             persona_type: User's assigned persona
             signals: BehaviorSignals object
-            signal_tags: List of active signal tags
+            signal_tags: Set of active signal tags
 
         Returns:
             Human-readable explanation string with concrete data
         """
-        if persona_type == "high_utilization":
-            credit = signals.credit or {}
-            utilization = credit.get("overall_utilization", 0.0)
-            total_balance = credit.get("total_balance", 0) / 100  # Convert cents to dollars
-            total_limit = credit.get("total_limit", 0) / 100
-
-            explanation = (
-                f"You've been identified as a High Utilization user because your credit card "
-                f"utilization is {utilization:.1f}%, which is above the recommended 30% threshold. "
-                f"You're currently using ${total_balance:,.2f} of your ${total_limit:,.2f} total credit limit. "
-            )
-
-            flags = credit.get("flags", [])
-            if "interest_charges" in flags:
-                explanation += "You're also paying interest charges on your balances, which adds to the cost of carrying debt. "
-            if "overdue" in flags:
-                explanation += "Additionally, you have overdue payments, which can negatively impact your credit score. "
-
-            explanation += (
-                "High credit utilization can hurt your credit score and lead to higher interest costs. "
-                "We recommend focusing on paying down high balances and keeping utilization below 30%."
-            )
-
-        elif persona_type == "variable_income":
-            income = signals.income or {}
-            median_gap = income.get("median_gap_days", 0)
-            buffer_months = income.get("buffer_months", 0.0)
-            avg_amount = income.get("average_amount", 0) / 100
-
-            explanation = (
-                f"You've been identified as a Variable Income user because your income arrives irregularly, "
-                f"with a median gap of {median_gap} days between payments. Your average income payment is "
-                f"${avg_amount:,.2f}, and you currently have {buffer_months:.1f} months of cash flow buffer. "
-                f"Variable income requires special budgeting strategies and a larger emergency fund. "
-                f"We recommend building your buffer to at least 6-12 months of expenses and using "
-                f"percentage-based budgeting rather than fixed amounts."
-            )
-
-        elif persona_type == "subscription_heavy":
-            subscriptions = signals.subscriptions or {}
-            count = subscriptions.get("count", 0)
-            monthly_spend = subscriptions.get("monthly_recurring_spend", 0) / 100
-            percentage = subscriptions.get("percentage_of_spending", 0.0)
-
-            explanation = (
-                f"You've been identified as a Subscription Heavy user because you have {count} active "
-                f"recurring subscriptions totaling ${monthly_spend:,.2f} per month. This represents "
-                f"{percentage:.1f}% of your total spending. While some subscriptions provide value, "
-                f"it's easy for unused subscriptions to accumulate. We recommend conducting a subscription "
-                f"audit to identify services you rarely use and canceling or downgrading them to save money."
-            )
-
-        elif persona_type == "savings_builder":
-            savings = signals.savings or {}
-            growth_rate = savings.get("growth_rate", 0.0)
-            monthly_inflow = savings.get("monthly_inflow", 0) / 100
-            credit = signals.credit or {}
-            utilization = credit.get("overall_utilization", 0.0)
-
-            explanation = (
-                f"You've been identified as a Savings Builder because you're making consistent progress "
-                f"toward your financial goals. Your savings are growing at {growth_rate:.1f}% with an average "
-                f"monthly inflow of ${monthly_inflow:,.2f}. Your credit utilization is {utilization:.1f}%, "
-                f"which is in a healthy range. Keep up the great work! We recommend focusing on building your "
-                f"emergency fund, automating your savings, and optimizing your investment strategy."
-            )
-
-        else:  # balanced
-            explanation = (
-                "You've been identified as a Balanced user, which means you're generally maintaining "
-                "healthy financial habits without critical issues requiring immediate attention. "
-            )
-
-            # Add specific insights based on available signals
-            insights = []
-
-            if signals.credit:
-                utilization = signals.credit.get("overall_utilization", 0.0)
-                if utilization < 30:
-                    insights.append(f"your credit utilization of {utilization:.1f}% is in a healthy range")
-
-            if signals.income:
-                stability = signals.income.get("stability", "unknown")
-                if stability == "stable":
-                    insights.append("you have stable, regular income")
-
-            if signals.savings:
-                monthly_inflow = signals.savings.get("monthly_inflow", 0)
-                if monthly_inflow > 0:
-                    insights.append(f"you're saving consistently with ${monthly_inflow/100:,.2f} monthly inflow")
-
-            if insights:
-                explanation += "Specifically, " + ", and ".join(insights) + ". "
-
-            explanation += (
-                "Continue monitoring your financial wellness and consider setting specific goals "
-                "to optimize your savings, reduce debt, or build wealth."
-            )
-
-        return explanation
+        handler = _EXPLANATION_HANDLERS.get(persona_type, _explain_balanced)
+        return handler(signals, signal_tags)
 
     def _generate_content_explanation(
         self,
         content_item: EducationItem,
         persona_type: str,
         signals: BehaviorSignals,
-        signal_tags: List[str]
+        signal_tags: FrozenSet[str]
     ) -> str:
         """
         Generate content-specific explanation with concrete data points.
 
         Creates an explanation that references the specific content being recommended
         and explains why it's relevant based on the user's behavioral signals.
+        Dispatches through _CONTENT_EXPLANATION_HANDLERS, falling back to a
+        generic sentence when the persona has no handler or its signals are
+        missing.
 
         Args:
             content_item: The education item being recommended
             persona_type: User's assigned persona
             signals: BehaviorSignals object
-            signal_tags: List of active signal tags
+            signal_tags: Set of active signal tags
 
         Returns:
             Human-readable explanation string with content-specific context
         """
-        # Generate concise, data-driven explanation
-        if persona_type == "high_utilization" and signals.credit:
-            utilization = signals.credit.get("overall_utilization", 0.0)
-            total_balance = signals.credit.get("total_balance", 0) / 100
-            explanation = (
-                f"Your credit utilization is {utilization:.1f}% with ${total_balance:,.0f} in balances"
-            )
-            if "interest_charges" in signal_tags:
-                explanation += ", and you're paying interest charges"
-            explanation += "."
-
-        elif persona_type == "subscription_heavy" and signals.subscriptions:
-            count = signals.subscriptions.get("count", 0)
-            monthly_spend = signals.subscriptions.get("monthly_recurring_spend", 0) / 100
-            explanation = (
-                f"You have {count} recurring subscriptions totaling ${monthly_spend:,.0f}/month."
-            )
-
-        elif persona_type == "variable_income" and signals.income:
-            median_gap = signals.income.get("median_gap_days", 0)
-            buffer_months = signals.income.get("buffer_months", 0.0)
-            explanation = (
-                f"Your income arrives every {median_gap} days with {buffer_months:.1f} months buffer."
-            )
-
-        elif persona_type == "savings_builder" and signals.savings:
-            monthly_inflow = signals.savings.get("monthly_inflow", 0) / 100
-            growth_rate = signals.savings.get("growth_rate", 0.0)
-            explanation = (
-                f"You're saving ${monthly_inflow:,.0f}/month with {growth_rate:.1f}% growth."
-            )
-
-        elif persona_type == "debt_consolidator" and signals.credit:
-            utilization = signals.credit.get("overall_utilization", 0.0)
-            explanation = (
-                f"You're managing multiple cards at {utilization:.1f}% utilization."
-            )
-
-        else:  # balanced or fallback
-            explanation = "This matches your current financial profile."
-
-        return explanation
+        handler = _CONTENT_EXPLANATION_HANDLERS.get(persona_type)
+        explanation = handler(signals, signal_tags) if handler is not None else None
+        return explanation or _CONTENT_EXPLANATION_FALLBACK
 
     def _load_offers_catalog(self) -> Dict[str, Any]:
         """
         Load partner offers catalog from YAML file.
 
-        Uses caching to avoid reloading on every call.
+        Parsed once per process (see _load_partner_offers_catalog) and then
+        cached on the instance.
 
         Returns:
             Dictionary containing 'partner_offers' list with offer items
@@ -642,16 +1065,30 @@ class TemplateGenerator(ContentGenerator):
         if not self.offers_catalog_path.exists():
             raise FileNotFoundError(f"Partner offers catalog not found: {self.offers_catalog_path}")
 
-        logger.info(f"Loading partner offers catalog from {self.offers_catalog_path}")
-
-        with open(self.offers_catalog_path, 'r') as f:
-            catalog = yaml.safe_load(f)
-
+        catalog, self._offers_by_persona = _load_partner_offers_catalog(
+            str(self.offers_catalog_path.resolve())
+        )
         self._offers_catalog_cache = catalog
-        logger.info(f"Loaded {len(catalog.get('partner_offers', []))} partner offers from catalog")
 
         return catalog
 
+    def reload_catalog(self) -> None:
+        """
+        Drop the parsed content and offers catalogs so the next request
+        re-reads them from disk.
+
+        Clears the process-wide loader caches as well as this instance's, so
+        other generators pick up the change on their next load too. Meant for
+        tests and for refreshing edited catalogs without a restart.
+        """
+        _load_content_catalog.cache_clear()
+        _load_partner_offers_catalog.cache_clear()
+        self._catalog_cache = None
+        self._offers_catalog_cache = None
+        self._persona_scorers = {}
+        self._education_rows = ()
+        self._offers_by_persona = {}
+
     def _estimate_credit_score(self, utilization: float) -> int:
         """
         Estimate credit score based on credit utilization percentage.
@@ -673,28 +1110,18 @@ class TemplateGenerator(ContentGenerator):
         Returns:
             Estimated credit score (300-850)
         """
-        if utilization <= 10.0:
-            # Excellent: 740-850
-            return int(850 - (utilization * 11))  # 850 at 0%, 740 at 10%
-        elif utilization <= 30.0:
-            # Good: 670-739
-            return int(739 - ((utilization - 10.0) * 3.45))  # 739 at 10%, 670 at 30%
-        elif utilization <= 50.0:
-            # Fair: 580-669
-            return int(669 - ((utilization - 30.0) * 4.45))  # 669 at 30%, 580 at 50%
-        elif utilization <= 75.0:
-            # Poor: 500-579
-            return int(579 - ((utilization - 50.0) * 3.16))  # 579 at 50%, 500 at 75%
-        else:
-            # Very Poor: 300-499
-            return int(max(300, 500 - ((utilization - 75.0) * 8)))  # 500 at 75%, 300 at 100%
+        start, base, slope = CREDIT_SCORE_BANDS[bisect_left(CREDIT_SCORE_UTILIZATION_THRESHOLDS, utilization)]
+        return int(max(300, base - ((utilization - start) * slope)))
 
     def _check_eligibility(
         self,
         offer_data: Dict[str, Any],
         signals: BehaviorSignals,
-        accounts: List,
-        signal_tags: List[str]
+        account_types: FrozenSet[str],
+        account_subtypes: FrozenSet[str],
+        signal_tags: FrozenSet[str],
+        utilization: Optional[float],
+        estimated_score: Optional[int]
     ) -> bool:
         """
         Check if user meets eligibility requirements for an offer.
@@ -703,20 +1130,42 @@ class TemplateGenerator(ContentGenerator):
         ALL specified criteria to be eligible.
 
         Args:
-            offer_data: Dictionary containing offer data from catalog
+            offer_data: Offer from a loaded catalog (with precomputed rule sets)
             signals: BehaviorSignals object with computed user data
-            accounts: List of user's Account objects
-            signal_tags: List of active signal tags
+            account_types: Types of the user's accounts
+            account_subtypes: Subtypes of the user's accounts
+            signal_tags: Set of active signal tags
+            utilization: Overall credit utilization (None without credit data)
+            estimated_score: _estimate_credit_score(utilization), computed once
+                             per request by the caller (None without credit data)
 
         Returns:
             True if user meets all eligibility criteria, False otherwise
         """
-        rules = offer_data.get("eligibility_rules", {})
+        rules = offer_data["eligibility_rules"]
 
-        # Check credit utilization requirements
-        if signals.credit:
-            utilization = signals.credit.get("overall_utilization", 0.0)
+        # Rules run cheapest and most selective first, so most rejections
+        # return after a set test or two: signal tags, then account types,
+        # then the numeric thresholds
 
+        # Check excluded signals (any match disqualifies)
+        if not rules["_excluded_signals"].isdisjoint(signal_tags):
+            return False
+
+        # Check required signals (AND logic - all must be present)
+        if not rules["_required_signals"] <= signal_tags:
+            return False
+
+        # Check account type requirements (all must be present)
+        if not rules["_required_account_types"] <= account_types:
+            return False
+
+        # Check excluded account subtypes (any match disqualifies)
+        if not rules["_excluded_account_subtypes"].isdisjoint(account_subtypes):
+            return False
+
+        # Check credit utilization requirements
+        if utilization is not None:
             if "min_credit_utilization" in rules:
                 if utilization < rules["min_credit_utilization"]:
                     return False
@@ -726,8 +1175,6 @@ class TemplateGenerator(ContentGenerator):
                     return False
 
             # Check credit score estimate
-            estimated_score = self._estimate_credit_score(utilization)
-
             if "min_credit_score_estimate" in rules:
                 if estimated_score < rules["min_credit_score_estimate"]:
                     return False
@@ -744,32 +1191,6 @@ class TemplateGenerator(ContentGenerator):
             if monthly_income < rules["min_monthly_income"]:
                 return False
 
-        # Check account type requirements
-        if "required_account_types" in rules and rules["required_account_types"]:
-            account_types = {acc.type for acc in accounts}
-            for required_type in rules["required_account_types"]:
-                if required_type not in account_types:
-                    return False
-
-        # Check excluded account subtypes
-        if "excluded_account_subtypes" in rules and rules["excluded_account_subtypes"]:
-            account_subtypes = {acc.subtype for acc in accounts}
-            for excluded_subtype in rules["excluded_account_subtypes"]:
-                if excluded_subtype in account_subtypes:
-                    return False
-
-        # Check required signals (AND logic - all must be present)
-        if "required_signals" in rules and rules["required_signals"]:
-            for required_signal in rules["required_signals"]:
-                if required_signal not in signal_tags:
-                    return False
-
-        # Check excluded signals (any match disqualifies)
-        if "excluded_signals" in rules and rules["excluded_signals"]:
-            for excluded_signal in rules["excluded_signals"]:
-                if excluded_signal in signal_tags:
-                    return False
-
         # Check emergency fund requirements
         if signals.savings:
             emergency_months = signals.savings.get("emergency_fund_months", 0.0)
@@ -791,6 +1212,21 @@ class TemplateGenerator(ContentGenerator):
         signals: BehaviorSignals,
         accounts: List,
         limit: int = 3
+    ) -> List[PartnerOffer]:
+        """ContentGenerator entry point; the work is synchronous (_generate_offers_sync)."""
+        return self._generate_offers_sync(
+            persona_type=persona_type,
+            signals=signals,
+            accounts=accounts,
+            limit=limit
+        )
+
+    def _generate_offers_sync(
+        self,
+        persona_type: str,
+        signals: BehaviorSignals,
+        accounts: List,
+        limit: int = 3
     ) -> List[PartnerOffer]:
         """
         Generate personalized partner offers with eligibility checking.
@@ -821,48 +1257,40 @@ class TemplateGenerator(ContentGenerator):
             logger.warning("No partner offers found in catalog")
             return []
 
-        # Extract signal tags for eligibility checking
+        # Extract signal tags and account type sets once for all offers
         signal_tags = self._extract_signal_tags(signals)
+        account_types = frozenset(acc.type for acc in accounts)
+        account_subtypes = frozenset(acc.subtype for acc in accounts)
+
+        # Utilization and the credit score estimate are the same for every offer
+        if signals.credit:
+            utilization = signals.credit.get("overall_utilization", 0.0)
+            estimated_score = self._estimate_credit_score(utilization)
+        else:
+            utilization = estimated_score = None
 
         # Filter and score offers
         scored_offers = []
-        persona_filtered = 0
         eligibility_filtered = 0
 
-        for offer_data in all_offers:
-            # Check if offer is relevant to persona
-            persona_tags = offer_data.get("persona_tags", [])
-            if persona_type not in persona_tags:
-                persona_filtered += 1
-                continue
+        # Only offers tagged with the persona are candidates (index built at load)
+        persona_offers = self._offers_by_persona.get(persona_type, ())
+        persona_filtered = len(all_offers) - len(persona_offers)
 
+        for offer_data in persona_offers:
             # Check eligibility
-            is_eligible = self._check_eligibility(offer_data, signals, accounts, signal_tags)
+            is_eligible = self._check_eligibility(
+                offer_data, signals, account_types, account_subtypes, signal_tags,
+                utilization, estimated_score
+            )
             if not is_eligible:
                 eligibility_filtered += 1
-                logger.debug(f"Offer {offer_data['id']} not eligible for user")
+                logger.debug("Offer %s not eligible for user", offer_data["id"])
                 continue
 
             # Calculate relevance score (similar to education content)
             raw_score = self._calculate_relevance(offer_data, persona_type, signal_tags)
-
-            # Create PartnerOffer object
-            partner_offer = PartnerOffer(
-                id=offer_data["id"],
-                title=offer_data["title"],
-                provider=offer_data["provider"],
-                offer_type=offer_data["offer_type"],
-                summary=offer_data["summary"],
-                benefits=offer_data["benefits"],
-                eligibility_explanation=offer_data["eligibility_explanation"],
-                cta=offer_data["cta"],
-                cta_url=offer_data["cta_url"],
-                disclaimer=offer_data["disclaimer"],
-                relevance_score=self._convert_to_1_to_5_scale(raw_score),
-                eligibility_met=True
-            )
-
-            scored_offers.append((raw_score, partner_offer))
+            scored_offers.append((raw_score, offer_data))
 
         # Decision trace: Offers filtered out
         logger.info(
@@ -872,8 +1300,8 @@ class TemplateGenerator(ContentGenerator):
             f"{len(scored_offers)} eligible"
         )
 
-        # Sort by relevance score (highest first)
-        scored_offers.sort(reverse=True, key=lambda x: x[0])
+        # Keep the top N by score (highest first, ties in catalog order)
+        top_scored = heapq.nlargest(limit, scored_offers, key=operator.itemgetter(0))
 
         # Decision trace: Offers ranked but not selected
         if len(scored_offers) > limit:
@@ -882,8 +1310,24 @@ class TemplateGenerator(ContentGenerator):
                 f"(below top {limit})"
             )
 
-        # Return top N offers
-        top_offers = [offer for score, offer in scored_offers[:limit]]
+        # Create PartnerOffer objects for the top N only
+        top_offers = [
+            PartnerOffer(
+                id=offer_data["id"],
+                title=offer_data["title"],
+                provider=offer_data["provider"],
+                offer_type=offer_data["offer_type"],
+                summary=offer_data["summary"],
+                benefits=offer_data["benefits"],
+                eligibility_explanation=offer_data["eligibility_explanation"],
+                cta=offer_data["cta"],
+                cta_url=offer_data["cta_url"],
+                disclaimer=offer_data["disclaimer"],
+                relevance_score=self._convert_to_1_to_5_scale(raw_score),
+                eligibility_met=True
+            )
+            for raw_score, offer_data in top_scored
+        ]
 
         logger.info(f"Generated {len(top_offers)} eligible partner offers from {len(all_offers)} total offers")
 
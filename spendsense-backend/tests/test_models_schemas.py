@@ -10,6 +10,10 @@ from pydantic import ValidationError
 
 from spendsense.models.user import User
 from spendsense.models.account import Account
+from spendsense.models.coded_enum import CodedEnum
+from spendsense.models.feedback import FeedbackType
+from spendsense.models.persona import PERSONA_TYPE_CODES
+from spendsense.personas.types import PERSONA_PRIORITY
 from spendsense.schemas.insight import (
     EducationItemResponse,
     PartnerOfferResponse,
@@ -95,6 +99,28 @@ class TestAccountModel:
         assert account.limit == 1000000
 
 
+@pytest.mark.unit
+class TestCodedEnum:
+    """Test small-integer encoding of categorical columns"""
+
+    def test_enum_round_trip(self):
+        """Members, values and names all encode to the same code"""
+        coded = CodedEnum(FeedbackType)
+        for value in (FeedbackType.INACCURATE, "inaccurate", "INACCURATE"):
+            assert coded.process_bind_param(value, None) == 2
+        assert coded.process_result_value(2, None) is FeedbackType.INACCURATE
+        assert coded.process_result_value("2", None) is FeedbackType.INACCURATE
+
+    def test_unknown_value_rejected(self):
+        """Values outside the set raise instead of storing a bad code"""
+        with pytest.raises(ValueError):
+            CodedEnum(FeedbackType).process_bind_param("great", None)
+
+    def test_persona_codes_follow_priority(self):
+        """Persona codes double as priority ranks"""
+        assert PERSONA_TYPE_CODES == PERSONA_PRIORITY
+
+
 @pytest.mark.unit
 class TestPydanticSchemas:
     """Test Pydantic schema validation and serialization"""
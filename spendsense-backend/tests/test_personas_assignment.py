@@ -4,11 +4,15 @@ Converted from scripts/test_persona_assignment.py to pytest format.
 Tests persona matching based on behavioral signals.
 """
 
+from datetime import datetime, timezone
+
 import pytest
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from spendsense.personas import assign_persona
 from spendsense.features import BehaviorSignals
+from spendsense.models.persona import Persona
+from spendsense.personas import assign_persona, assign_personas_bulk
 
 
 @pytest.mark.personas
@@ -141,6 +145,38 @@ class TestPersonaAssignment:
         # Should assign high_utilization even if savings also present
         assert result["persona_type"] == "high_utilization"
 
+    async def test_bulk_assignment_saves_all(self, db: AsyncSession, test_user, test_credit_card):
+        """Test bulk assignment matches single assignment and saves every row"""
+        # Distinct timestamps per call: the same user is assigned three times
+        first = datetime(2025, 2, 1, tzinfo=timezone.utc)
+        second = datetime(2025, 2, 2, tzinfo=timezone.utc)
+        third = datetime(2025, 2, 3, tzinfo=timezone.utc)
+        results = await assign_personas_bulk(db, [test_user.id, test_user.id], window_days=30, assigned_at=first)
+        results += await assign_personas_bulk(db, [test_user.id], window_days=30, assigned_at=second)
+        single = await assign_persona(db, test_user.id, window_days=30, assigned_at=third)
+
+        assert len(results) == 3
+        assert all(r["persona_type"] == single["persona_type"] for r in results)
+        assert all(r["confidence"] == single["confidence"] for r in results)
+
+        # The duplicate user_id within one call shares its timestamp, so it is
+        # stored once; the other two calls each add a row
+        count = await db.execute(
+            select(func.count(Persona.id)).where(Persona.user_id == test_user.id)
+        )
+        assert count.scalar() == 3
+
+    async def test_bulk_assignment_retry_is_idempotent(self, db: AsyncSession, test_user, test_credit_card):
+        """Test re-running an assignment with the same timestamp stores one row"""
+        assigned_at = datetime(2025, 1, 1, tzinfo=timezone.utc)
+        await assign_personas_bulk(db, [test_user.id], window_days=30, assigned_at=assigned_at)
+        await assign_persona(db, test_user.id, window_days=30, assigned_at=assigned_at)
+
+        count = await db.execute(
+            select(func.count(Persona.id)).where(Persona.user_id == test_user.id)
+        )
+        assert count.scalar() == 1
+
 
 @pytest.mark.personas
 @pytest.mark.unit
@@ -4,9 +4,12 @@ Converted from scripts/test_template_generator.py to pytest format.
 Tests template-based content selection and scoring.
 """
 
+import os
+
 import pytest
-from spendsense.recommend.content_selection import TemplateGenerator
+
 from spendsense.features import BehaviorSignals
+from spendsense.recommend.content_selection import TemplateGenerator, _read_catalog
 
 
 @pytest.mark.recommendations
@@ -169,3 +172,62 @@ class TestTemplateGenerator:
         assert rationale.confidence == 0.92
         assert len(rationale.explanation) > 0
         assert len(rationale.key_signals) > 0
+
+    def test_persona_scorers_match_relevance(self):
+        """Test that persona scorers agree with _calculate_relevance"""
+        generator = TemplateGenerator()
+        education_items = generator._load_catalog()["education"]
+
+        tag_sets = [
+            set(),
+            {"high_utilization_80", "interest_charges"},
+            {"subscription_heavy", "low_emergency_fund", "stable_income"},
+            {"variable_income", "positive_savings", "moderate_utilization_30"},
+        ]
+
+        for persona_type in ["high_utilization", "subscription_heavy", "balanced", "unknown"]:
+            scorer = generator._persona_scorers.get(persona_type) or generator._persona_scorers[None]
+            for tags in tag_sets:
+                expected = [
+                    (i, generator._calculate_relevance(item, persona_type, list(tags)))
+                    for i, item in enumerate(education_items)
+                ]
+                expected = [(i, score) for i, score in expected if score > 0]
+                assert scorer(tags) == expected
+
+    def test_catalog_parse_cache(self, tmp_path):
+        """Test that the JSON catalog parse cache is written and refreshed on change"""
+        catalog_path = tmp_path / "catalog.yaml"
+        catalog_path.write_text("education:\n  - id: a\n")
+
+        assert _read_catalog(catalog_path) == {"education": [{"id": "a"}]}
+        assert (tmp_path / "catalog.cache.json").exists()
+        assert _read_catalog(catalog_path) == {"education": [{"id": "a"}]}
+
+        catalog_path.write_text("education:\n  - id: bb\n")
+        stat = catalog_path.stat()
+        os.utime(catalog_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        assert _read_catalog(catalog_path) == {"education": [{"id": "bb"}]}
+
+        # A corrupt cache is ignored and rewritten from the YAML
+        (tmp_path / "catalog.cache.json").write_text("not json")
+        assert _read_catalog(catalog_path) == {"education": [{"id": "bb"}]}
+
+    def test_reload_catalog(self, tmp_path):
+        """Test that reload_catalog picks up an edited offers catalog"""
+        offers_path = tmp_path / "offers.yaml"
+        offers_path.write_text("partner_offers:\n  - id: a\n")
+        generator = TemplateGenerator(offers_catalog_path=str(offers_path))
+
+        def offer_ids():
+            return [offer["id"] for offer in generator._load_offers_catalog()["partner_offers"]]
+
+        assert offer_ids() == ["a"]
+
+        offers_path.write_text("partner_offers:\n  - id: bb\n")
+        stat = offers_path.stat()
+        os.utime(offers_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        assert offer_ids() == ["a"]
+
+        generator.reload_catalog()
+        assert offer_ids() == ["bb"]